@@ -0,0 +1,197 @@
+import heapq
+from collections import deque
+from enum import IntEnum
+from itertools import count, islice
+from typing import Callable, Iterable, List, Optional, Tuple
+from utils.background import cancel_checker
+from utils.profiling import active_profile
+
+# Horizon of a closed kernel: no input can come any more.
+END_OF_TIME = float('inf')
+
+# Inputs read from a lazy source at a time.
+PULL_BATCH = 256
+
+class EventType(IntEnum):
+    """Kinds of simulation event. Events due at the same time run in this order."""
+    COMPLETION = 0
+    RELEASE = 1
+    ARRIVAL = 2
+    QUANTUM_EXPIRY = 3
+    ACQUIRE = 4
+
+# Module-level aliases for hot loops, where looking members up on the enum
+# class is several times slower than a global.
+COMPLETION = EventType.COMPLETION
+RELEASE = EventType.RELEASE
+ARRIVAL = EventType.ARRIVAL
+QUANTUM_EXPIRY = EventType.QUANTUM_EXPIRY
+ACQUIRE = EventType.ACQUIRE
+
+Handler = Callable[[int, object], None]
+
+class EventKernel:
+    """Discrete-event loop shared by the scheduling and synchronization engines.
+    
+    Engine events go through a heap; time-ordered inputs (arrivals, requests) are fed
+    or pulled from ``follow`` and skip it. ``run`` handles events up to ``horizon``.
+    """
+    
+    def __init__(self, input_type: EventType = EventType.ARRIVAL):
+        self.input_type = input_type
+        self.handlers: List[Optional[Handler]] = [None] * len(EventType)
+        self.step: Optional[Callable[[int], None]] = None
+        self.now = 0
+        self.horizon = -1
+        self.events = []
+        self.inputs = deque()
+        self._sequence = count()
+        self._source = None
+        self._last_input = None
+        self._stopped = False
+        self.check_cancelled = cancel_checker()
+        self.profile = active_profile()
+        if self.profile is not None:
+            self.schedule = self._schedule_counted
+    
+    def on(self, event_type: EventType, handler: Handler) -> 'EventKernel':
+        if self.profile is not None:
+            handler = self._counted(event_type, handler)
+        self.handlers[event_type] = handler
+        return self
+    
+    def _counted(self, event_type: EventType, handler: Handler) -> Handler:
+        counters = self.profile.counters
+        name = f"events_{event_type.name.lower()}"
+        
+        def counted(time: int, payload: object) -> None:
+            counters[name] = counters.get(name, 0) + 1
+            handler(time, payload)
+        return counted
+    
+    @property
+    def closed(self) -> bool:
+        return self.horizon == END_OF_TIME
+    
+    def schedule(self, time: int, event_type: EventType, payload: object = None) -> None:
+        heapq.heappush(self.events, (time, event_type, next(self._sequence), payload))
+    
+    def _schedule_counted(self, time: int, event_type: EventType, payload: object = None) -> None:
+        heapq.heappush(self.events, (time, event_type, next(self._sequence), payload))
+        self.profile.count('heap_pushes')
+        self.profile.peak('heap_peak', len(self.events))
+    
+    def feed(self, time: int, payload: object) -> None:
+        """Queue an input event; inputs must come in time order and after the horizon."""
+        if self.closed:
+            raise ValueError("Cannot feed a closed kernel")
+        if time <= self.horizon:
+            raise ValueError(f"Input at {time} is not after the kernel horizon "
+                             f"{self.horizon}; inputs must arrive in the future")
+        if self._last_input is not None and time < self._last_input:
+            raise ValueError(f"Input at {time} comes before the previous input at "
+                             f"{self._last_input}")
+        self._last_input = time
+        self.inputs.append((time, payload))
+    
+    def follow(self, source: Iterable[Tuple[int, object]]) -> None:
+        """Read inputs lazily from ``source``, (time, payload) pairs in time order."""
+        self._source = iter(source)
+    
+    def advance(self, time: int) -> None:
+        if time > self.horizon:
+            self.horizon = time
+    
+    def close(self) -> None:
+        self.horizon = END_OF_TIME
+    
+    def stop(self) -> None:
+        """Make ``run`` return after the current event; a later ``run`` resumes."""
+        self._stopped = True
+    
+    def _pull(self) -> bool:
+        """Feed the next batch of the source; False once it is exhausted."""
+        if self._source is None:
+            return False
+        batch = list(islice(self._source, PULL_BATCH))
+        if not batch:
+            self._source = None
+            self.horizon = END_OF_TIME
+            return False
+        
+        self.feed(*batch[0])
+        last = batch[0][0]
+        for time, _ in batch:
+            if time < last:
+                raise ValueError(f"Input at {time} comes before the previous input at {last}")
+            last = time
+        self.inputs.extend(batch[1:])
+        self._last_input = last
+        # The source is in time order, so everything before its last read
+        # input is known.
+        if last - 1 > self.horizon:
+            self.horizon = last - 1
+        return True
+    
+    def next_input_bound(self) -> float:
+        """Earliest time the next input can come, or just past the horizon while unknown."""
+        if not self.inputs:
+            self._pull()
+        if self.inputs:
+            return self.inputs[0][0]
+        if self.closed:
+            return END_OF_TIME
+        return self.horizon + 1
+    
+    def _know(self, time: int) -> bool:
+        """Whether every input up to ``time`` is known, pulling from the source if needed."""
+        while time > self.horizon:
+            if not self._pull():
+                return self.closed
+        return True
+    
+    def run(self) -> None:
+        """Handle every event due up to the horizon, or until ``stop`` is called."""
+        events, inputs, handlers = self.events, self.inputs, self.handlers
+        input_type = self.input_type
+        input_handler = handlers[input_type]
+        step = self.step
+        check_cancelled = self.check_cancelled
+        heappop = heapq.heappop
+        self._stopped = False
+        
+        while not self._stopped:
+            if check_cancelled is not None:
+                check_cancelled()
+            if not inputs and self._source is not None:
+                self._pull()
+            if inputs:
+                time = inputs[0][0]
+                if events and events[0][0] < time:
+                    time = events[0][0]
+            elif events:
+                time = events[0][0]
+            else:
+                break
+            if time > self.horizon and not self._know(time):
+                break
+            self.now = time
+            
+            # Events that sort before the inputs, then the inputs, then the rest.
+            while events and events[0][0] == time and events[0][1] < input_type:
+                event = heappop(events)
+                handlers[event[1]](time, event[3])
+                if self._stopped:
+                    return
+            while inputs and inputs[0][0] == time:
+                input_handler(time, inputs.popleft()[1])
+                if self._stopped:
+                    return
+            while events and events[0][0] == time:
+                event = heappop(events)
+                handlers[event[1]](time, event[3])
+                if self._stopped:
+                    return
+            
+            if step is not None:
+                step(time)
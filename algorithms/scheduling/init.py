@@ -3,6 +3,7 @@ from .sjf import SJF
 from .srt import SRT
 from .round_robin import RoundRobin
 from .priority import Priority
+from .smp import SMP
 
-__all__ = ['FIFO', 'SJF', 'SRT', 'RoundRobin', 'Priority']
+__all__ = ['FIFO', 'SJF', 'SRT', 'RoundRobin', 'Priority', 'SMP']
 
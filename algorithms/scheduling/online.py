@@ -0,0 +1,315 @@
+import heapq
+from collections import deque
+from itertools import count
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Tuple, Union
+from models.process import Process
+from models.schedule import Schedule, Segment
+from algorithms.kernel import (COMPLETION, END_OF_TIME, QUANTUM_EXPIRY, EventKernel,
+                               EventType)
+from utils.background import cancel_checker, progress_reporter
+from utils.profiling import active_profile
+
+POLICIES = ('FIFO', 'SJF', 'SRT', 'RR', 'PRIORITY')
+
+class OnlineScheduler:
+    """One CPU fed by a live arrival stream, built on an EventKernel.
+    
+    ``advance(now)`` promises every arrival up to ``now`` was pushed and returns the
+    segments that became final; ``close`` returns the rest. With ``merge_slices`` a
+    Round Robin process alone in the queue runs up to the next arrival in one step.
+    """
+    
+    def __init__(self, algorithm: str = 'FIFO', quantum: int = 2,
+                 merge_slices: bool = False):
+        if algorithm not in POLICIES:
+            raise ValueError(f"Unknown policy '{algorithm}', expected one of {POLICIES}")
+        if algorithm == 'RR' and quantum <= 0:
+            raise ValueError(f"Quantum must be positive, got {quantum}")
+        
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.completed = 0
+        # Process on the CPU, the start of its current run and the version of
+        # its end event; a preemption bumps the version to cancel that event.
+        self.running = None
+        self.segment_start = 0
+        self.version = 0
+        self.preemptions = 0
+        # Segments not yet handed out; any container with ``append`` works.
+        self.decided: List[Segment] = []
+        # Called with the number of completed processes, e.g. a progress reporter.
+        self.report = None
+        self._preemptive = algorithm == 'SRT'
+        self._sliced = algorithm == 'RR'
+        self._merging = merge_slices and self._sliced
+        self._streaming = False
+        
+        self.kernel = EventKernel(EventType.ARRIVAL)
+        self.kernel.on(EventType.ARRIVAL, self._arrive)
+        self.kernel.on(EventType.COMPLETION, self._complete)
+        self.kernel.on(EventType.QUANTUM_EXPIRY, self._expire)
+        self.kernel.step = self._dispatch
+        
+        # Heap entries end with a push counter so processes are never compared.
+        if algorithm in ('FIFO', 'RR'):
+            self.ready = deque()
+            self._enqueue = self.ready.append
+            self._take = self.ready.popleft
+        else:
+            sequence = count()
+            if algorithm == 'SJF':
+                entry = lambda p: (p.burst_time, p.arrival_time, p.pid, next(sequence), p)
+            elif algorithm == 'PRIORITY':
+                entry = lambda p: (p.priority, p.arrival_time, p.pid, next(sequence), p)
+            else:
+                entry = lambda p: (p.remaining_time, p.arrival_time, p.pid,
+                                   next(sequence), p)
+            self.ready = ready = []
+            self._enqueue = lambda p: heapq.heappush(ready, entry(p))
+            self._take = lambda: heapq.heappop(ready)[-1]
+        
+        # Only a profiled run pays for tracking the ready queue's high-water mark.
+        self.profile = active_profile()
+        if self.profile is not None:
+            enqueue, ready, profile = self._enqueue, self.ready, self.profile
+            
+            def counted(process: Process) -> None:
+                enqueue(process)
+                profile.peak('ready_peak', len(ready))
+            self._enqueue = counted
+    
+    @property
+    def horizon(self) -> float:
+        return self.kernel.horizon
+    
+    @property
+    def closed(self) -> bool:
+        return self.kernel.closed
+    
+    @property
+    def current_time(self) -> int:
+        return self.kernel.now
+    
+    @property
+    def backlog(self) -> int:
+        """Processes held by the scheduler: pushed, ready or on the CPU."""
+        held = len(self.kernel.inputs) + len(self.ready)
+        return held + (self.running is not None)
+    
+    def push(self, process: Process) -> None:
+        try:
+            self.kernel.feed(process.arrival_time, process)
+        except ValueError as e:
+            raise ValueError(f"Process {process.pid}: {e}") from None
+        self._admit(process)
+    
+    def advance(self, now: int) -> List[Segment]:
+        self.kernel.advance(now)
+        return self.run()
+    
+    def close(self) -> List[Segment]:
+        self.kernel.close()
+        return self.run()
+    
+    def stream(self, processes: Iterable[Process]) -> Iterator[Segment]:
+        """Push ``processes`` (in arrival order) lazily and yield segments as they are decided."""
+        self.follow(processes)
+        return self._stream()
+    
+    def follow(self, processes: Iterable[Process]) -> None:
+        """Read ``processes`` (in arrival order) lazily as the simulation reaches them."""
+        if self.algorithm in ('SRT', 'RR'):
+            self.kernel.follow((p.arrival_time, self._admit(p)) for p in processes)
+        else:
+            self.kernel.follow((p.arrival_time, p) for p in processes)
+    
+    def _admit(self, process: Process) -> Process:
+        if self.algorithm in ('SRT', 'RR'):
+            process.remaining_time = process.burst_time
+            process.start_time = None
+        return process
+    
+    def run(self) -> List[Segment]:
+        """Simulate as far as the known arrivals allow and return the new segments."""
+        self.kernel.run()
+        decided, self.decided = self.decided, []
+        return decided
+    
+    def _stream(self) -> Iterator[Segment]:
+        # The step hook stops the kernel whenever it decided segments, so
+        # they are handed out before the simulation moves on.
+        self._streaming = True
+        try:
+            while True:
+                self.kernel.run()
+                if not self.decided:
+                    break
+                decided, self.decided = self.decided, []
+                yield from decided
+        finally:
+            self._streaming = False
+    
+    def _arrive(self, time: int, process: Process) -> None:
+        self._enqueue(process)
+    
+    def _complete(self, time: int, version: int) -> None:
+        if version != self.version:
+            return
+        process = self.running
+        self.running = None
+        if self._preemptive:
+            process.remaining_time = 0
+            self.decided.append((process.pid, self.segment_start, time))
+        process.completion_time = time
+        process.calculate_metrics()
+        self.completed += 1
+        if self.report:
+            self.report(self.completed)
+    
+    def _expire(self, time: int, process: Process) -> None:
+        # Arrivals due now were handled first, so the slice requeues behind them.
+        self.running = None
+        self._enqueue(process)
+    
+    def _dispatch(self, time: int) -> None:
+        ready = self.ready
+        running = self.running
+        if running is None:
+            if ready:
+                self._start(self._take(), time)
+        elif self._preemptive and ready:
+            remaining = running.remaining_time - (time - self.segment_start)
+            if ready[0][0] < remaining:
+                self.preemptions += 1
+                running.remaining_time = remaining
+                self.decided.append((running.pid, self.segment_start, time))
+                self._enqueue(running)
+                self._start(self._take(), time)
+        
+        if self._streaming and self.decided:
+            self.kernel.stop()
+    
+    def _start(self, process: Process, time: int) -> None:
+        self.running = process
+        self.segment_start = time
+        self.version += 1
+        
+        if self._preemptive:
+            # SRT: the run is decided when it completes or is preempted.
+            if process.start_time is None:
+                process.start_time = time
+            self.kernel.schedule(time + process.remaining_time, COMPLETION, self.version)
+        elif self._sliced:
+            if process.start_time is None:
+                process.start_time = time
+            quantum = self.quantum
+            execution_time = min(quantum, process.remaining_time)
+            if self._merging and not self.ready:
+                # Alone in the queue: run every slice up to the one that ends
+                # at or after the next arrival in a single step.
+                gap = self.kernel.next_input_bound() - time
+                if gap == END_OF_TIME:
+                    execution_time = process.remaining_time
+                else:
+                    slices = max(1, -(-gap // quantum))
+                    execution_time = min(slices * quantum, process.remaining_time)
+            process.remaining_time -= execution_time
+            end_time = time + execution_time
+            decided = self.decided
+            if self._merging and decided:
+                pid, start_time, last_end = decided[-1]
+                if pid == process.pid and last_end == time:
+                    decided[-1] = (pid, start_time, end_time)
+                else:
+                    decided.append((process.pid, time, end_time))
+            else:
+                decided.append((process.pid, time, end_time))
+            if process.remaining_time == 0:
+                self.kernel.schedule(end_time, COMPLETION, self.version)
+            else:
+                self.kernel.schedule(end_time, QUANTUM_EXPIRY, process)
+        else:
+            end_time = time + process.burst_time
+            process.start_time = time
+            self.decided.append((process.pid, time, end_time))
+            self.kernel.schedule(end_time, COMPLETION, self.version)
+
+def _schedule_non_preemptive(processes: List[Process], algorithm: str,
+                             schedule: Union[List[Segment], Schedule]) -> None:
+    """FIFO, SJF or Priority in one pass over the arrivals, with OnlineScheduler tie-breaking."""
+    order = sorted(processes, key=attrgetter('arrival_time'))
+    total = len(order)
+    report = progress_reporter(total)
+    check_cancelled = cancel_checker()
+    profile = active_profile()
+    append = schedule.append
+    ready = []
+    ready_peak = 0
+    cursor = 0
+    current_time = 0
+    
+    for done in range(1, total + 1):
+        if algorithm == 'FIFO':
+            process = order[done - 1]
+            if current_time < process.arrival_time:
+                current_time = process.arrival_time
+            if profile is not None:
+                while cursor < total and order[cursor].arrival_time <= current_time:
+                    cursor += 1
+                ready_peak = max(ready_peak, cursor - done + 1)
+        else:
+            if not ready and current_time < order[cursor].arrival_time:
+                current_time = order[cursor].arrival_time
+            while cursor < total and order[cursor].arrival_time <= current_time:
+                p = order[cursor]
+                key = p.burst_time if algorithm == 'SJF' else p.priority
+                heapq.heappush(ready, (key, p.arrival_time, p.pid, cursor, p))
+                cursor += 1
+            if len(ready) > ready_peak:
+                ready_peak = len(ready)
+            process = heapq.heappop(ready)[-1]
+        
+        end_time = current_time + process.burst_time
+        process.start_time = current_time
+        process.completion_time = end_time
+        process.calculate_metrics()
+        append((process.pid, current_time, end_time))
+        current_time = end_time
+        if report:
+            report(done)
+        if check_cancelled is not None:
+            check_cancelled()
+    
+    if profile is not None:
+        profile.count('events_arrival', total)
+        profile.count('events_completion', total)
+        profile.count('preemptions', 0)
+        profile.peak('ready_peak', ready_peak)
+
+def schedule_batch(processes: List[Process], algorithm: str, quantum: int = 2,
+                   compact: bool = False,
+                   merge_slices: bool = False) -> Union[List[Tuple[str, int, int]], Schedule]:
+    """Schedule a complete workload; FIFO, SJF and Priority skip the event kernel."""
+    if algorithm not in POLICIES:
+        raise ValueError(f"Unknown policy '{algorithm}', expected one of {POLICIES}")
+    schedule = Schedule() if compact else []
+    if not processes:
+        return schedule
+    if compact:
+        # Interning in input order lets the metrics skip realigning the
+        # schedule with the workload.
+        for p in processes:
+            schedule.intern(p.pid)
+    if algorithm in ('FIFO', 'SJF', 'PRIORITY'):
+        _schedule_non_preemptive(processes, algorithm, schedule)
+        return schedule
+
+    scheduler = OnlineScheduler(algorithm, quantum, merge_slices)
+    scheduler.decided = schedule
+    scheduler.report = progress_reporter(len(processes))
+    scheduler.follow(sorted(processes, key=attrgetter('arrival_time')))
+    schedule = scheduler.run()
+    if scheduler.profile is not None:
+        scheduler.profile.count('preemptions', scheduler.preemptions)
+    return schedule
@@ -1,35 +1,11 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from models.process import Process
+from models.schedule import Schedule
+from algorithms.scheduling.online import schedule_batch
 
 class SJF:
     @staticmethod
-    def schedule(processes: List[Process]) -> List[Tuple[str, int, int]]:
-        if not processes:
-            return []
-        
-        schedule = []
-        current_time = 0
-        remaining_processes = processes.copy()
-        
-        while remaining_processes:
-            available = [p for p in remaining_processes if p.arrival_time <= current_time]
-            
-            if not available:
-                current_time = min(p.arrival_time for p in remaining_processes)
-                continue
-            
-            selected = min(available, key=lambda p: p.burst_time)
-            
-            start_time = current_time
-            end_time = current_time + selected.burst_time
-            
-            selected.start_time = start_time
-            selected.completion_time = end_time
-            selected.calculate_metrics()
-            
-            schedule.append((selected.pid, start_time, end_time))
-            current_time = end_time
-            remaining_processes.remove(selected)
-        
-        return schedule
-
+    def schedule(processes: List[Process],
+                 compact: bool = False) -> Union[List[Tuple[str, int, int]], Schedule]:
+        # Ties are broken by (burst_time, arrival_time, pid, arrival order)
+        return schedule_batch(processes, 'SJF', compact=compact)
@@ -0,0 +1,218 @@
+import heapq
+from itertools import count
+from typing import List
+from models.process import Process
+from models.schedule import CoreSchedule
+from utils.background import cancel_checker, progress_reporter
+from utils.profiling import active_profile
+from algorithms.scheduling.online import POLICIES
+
+GLOBAL_QUEUE = 'global'
+PER_CORE_QUEUES = 'per-core'
+QUEUE_MODES = (GLOBAL_QUEUE, PER_CORE_QUEUES)
+
+class SMP:
+    """One policy dispatching onto ``cores`` CPUs from a global queue or per-core queues.
+    
+    With ``steal`` an idle per-core CPU takes the best process of the longest queue.
+    """
+    
+    @staticmethod
+    def schedule(processes: List[Process], algorithm: str = 'FIFO', cores: int = 2,
+                 quantum: int = 2, queues: str = GLOBAL_QUEUE,
+                 steal: bool = False) -> CoreSchedule:
+        if algorithm not in POLICIES:
+            raise ValueError(f"Unknown policy '{algorithm}', expected one of {POLICIES}")
+        if cores <= 0:
+            raise ValueError(f"Core count must be positive, got {cores}")
+        if queues not in QUEUE_MODES:
+            raise ValueError(f"Unknown queue mode '{queues}', expected one of {QUEUE_MODES}")
+        if algorithm == 'RR' and quantum <= 0:
+            raise ValueError(f"Quantum must be positive, got {quantum}")
+        
+        schedule = CoreSchedule(cores)
+        if not processes:
+            return schedule
+        
+        # PIDs are interned up front in input order, which also lets the
+        # metrics skip realigning the schedule with the processes.
+        pid_indices = [schedule.intern(p.pid) for p in processes]
+        append_pid = schedule.pid_column.append
+        append_start = schedule.start_column.append
+        append_end = schedule.end_column.append
+        append_core = schedule.core_column.append
+        
+        for p in processes:
+            p.remaining_time = p.burst_time
+            p.start_time = None
+        
+        # Ready entries end with the input position. FIFO and RR order by a
+        # push counter; the others break ties like their single-core version.
+        sequence = count()
+        if algorithm in ('FIFO', 'RR'):
+            def entry(index):
+                return (next(sequence), index)
+        elif algorithm == 'SJF':
+            def entry(index):
+                p = processes[index]
+                return (p.burst_time, p.arrival_time, p.pid, index)
+        elif algorithm == 'PRIORITY':
+            def entry(index):
+                p = processes[index]
+                return (p.priority, p.arrival_time, p.pid, index)
+        else:
+            def entry(index):
+                p = processes[index]
+                return (p.remaining_time, p.arrival_time, p.pid, index)
+        
+        shared = queues == GLOBAL_QUEUE
+        preemptive = algorithm == 'SRT'
+        sliced = algorithm == 'RR'
+        steal = steal and not shared
+        
+        order = sorted(range(len(processes)), key=lambda i: processes[i].arrival_time)
+        total = len(order)
+        report = progress_reporter(total)
+        check_cancelled = cancel_checker()
+        profile = active_profile()
+        ready = [[]] if shared else [[] for _ in range(cores)]
+        running = [None] * cores
+        segment_starts = [0] * cores
+        ends = [0] * cores
+        versions = [0] * cores
+        events = []
+        # Global SRT: running jobs by latest end, i.e. longest remaining time.
+        longest = []
+        idle = list(range(cores)) if shared else None
+        hungry = set(range(cores)) if steal else None
+        waiting = 0
+        ready_peak = 0
+        preemptions = 0
+        steals = 0
+        cursor = 0
+        finished = 0
+        current_time = 0
+        
+        def start(core, index):
+            p = processes[index]
+            if p.start_time is None:
+                p.start_time = current_time
+            running[core] = index
+            segment_starts[core] = current_time
+            if sliced and quantum < p.remaining_time:
+                end_time = current_time + quantum
+            else:
+                end_time = current_time + p.remaining_time
+            ends[core] = end_time
+            versions[core] += 1
+            heapq.heappush(events, (end_time, core, versions[core]))
+            if preemptive and shared:
+                heapq.heappush(longest, (-end_time, core, versions[core]))
+        
+        def stop(core):
+            index = running[core]
+            segment_start = segment_starts[core]
+            append_pid(pid_indices[index])
+            append_start(segment_start)
+            append_end(current_time)
+            append_core(core)
+            processes[index].remaining_time -= current_time - segment_start
+            running[core] = None
+            versions[core] += 1
+            return index
+        
+        while finished < total:
+            if check_cancelled is not None:
+                check_cancelled()
+            while events and events[0][2] != versions[events[0][1]]:
+                heapq.heappop(events)
+            
+            if cursor < total and (not events or
+                                   processes[order[cursor]].arrival_time < events[0][0]):
+                current_time = processes[order[cursor]].arrival_time
+            else:
+                current_time = events[0][0]
+            
+            touched = None if shared else set()
+            requeued = [] if sliced else None
+            while events and events[0][0] == current_time:
+                end_time, core, version = heapq.heappop(events)
+                if version != versions[core]:
+                    continue
+                index = stop(core)
+                p = processes[index]
+                if p.remaining_time == 0:
+                    p.completion_time = current_time
+                    p.calculate_metrics()
+                    finished += 1
+                    if report:
+                        report(finished)
+                elif sliced:
+                    requeued.append((core, index))
+                if shared:
+                    heapq.heappush(idle, core)
+                else:
+                    touched.add(core)
+            
+            while cursor < total and processes[order[cursor]].arrival_time <= current_time:
+                queue = 0 if shared else cursor % cores
+                heapq.heappush(ready[queue], entry(order[cursor]))
+                waiting += 1
+                cursor += 1
+                if not shared:
+                    touched.add(queue)
+            
+            # As on one CPU, a slice that ends at an arrival requeues after it.
+            if requeued:
+                for core, index in requeued:
+                    heapq.heappush(ready[0 if shared else core], entry(index))
+                waiting += len(requeued)
+            if profile is not None and waiting > ready_peak:
+                ready_peak = waiting
+            
+            if shared:
+                queue = ready[0]
+                while idle and queue:
+                    start(heapq.heappop(idle), heapq.heappop(queue)[-1])
+                    waiting -= 1
+                
+                while preemptive and queue and not idle:
+                    negative_end, core, version = longest[0]
+                    if version != versions[core]:
+                        heapq.heappop(longest)
+                        continue
+                    if queue[0][0] >= -negative_end - current_time:
+                        break
+                    heapq.heappop(longest)
+                    preemptions += 1
+                    heapq.heappush(queue, entry(stop(core)))
+                    start(core, heapq.heappop(queue)[-1])
+                continue
+            
+            for core in touched:
+                queue = ready[core]
+                if running[core] is None:
+                    if queue:
+                        start(core, heapq.heappop(queue)[-1])
+                        waiting -= 1
+                        if steal:
+                            hungry.discard(core)
+                    elif steal:
+                        hungry.add(core)
+                elif preemptive and queue and queue[0][0] < ends[core] - current_time:
+                    preemptions += 1
+                    heapq.heappush(queue, entry(stop(core)))
+                    start(core, heapq.heappop(queue)[-1])
+            
+            while steal and hungry and waiting:
+                thief = min(hungry)
+                hungry.discard(thief)
+                start(thief, heapq.heappop(max(ready, key=len))[-1])
+                waiting -= 1
+                steals += 1
+        
+        if profile is not None:
+            profile.count('preemptions', preemptions)
+            profile.count('steals', steals)
+            profile.peak('ready_peak', ready_peak)
+        return schedule
@@ -0,0 +1,72 @@
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+class Deadlock:
+    """Deadlocked pids and a wait-for cycle of (pid, resource); the next pid holds each resource."""
+    
+    __slots__ = ('pids', 'cycle', 'time')
+    
+    def __init__(self, pids: List[str], cycle: List[Tuple[str, str]], time: int):
+        self.pids = pids
+        self.cycle = cycle
+        self.time = time
+    
+    def __repr__(self):
+        return f"Deadlock(pids={self.pids!r}, cycle={self.cycle!r}, time={self.time!r})"
+    
+    def describe(self) -> str:
+        steps = " -> ".join(f"{pid} [{resource}]" for pid, resource in self.cycle)
+        return f"Ciclo {self.time}: {steps} -> {self.cycle[0][0]}"
+
+class WaitForGraph:
+    """Wait-for graph updated on acquire, release and block.
+    
+    A waiter waits for every holder of its resource, so ``block`` searches
+    breadth-first from it: O(P + H) in the worst case.
+    """
+    
+    def __init__(self):
+        self.holders: Dict[str, Dict[str, int]] = {}
+        self.waiting_on: Dict[str, str] = {}
+    
+    def add_hold(self, pid: str, resource: str) -> None:
+        holders = self.holders.setdefault(resource, {})
+        holders[pid] = holders.get(pid, 0) + 1
+    
+    def remove_hold(self, pid: str, resource: str) -> None:
+        holders = self.holders[resource]
+        if holders[pid] == 1:
+            del holders[pid]
+        else:
+            holders[pid] -= 1
+    
+    def unblock(self, pid: str) -> None:
+        self.waiting_on.pop(pid, None)
+    
+    def block(self, pid: str, resource: str, time: int) -> Optional[Deadlock]:
+        self.waiting_on[pid] = resource
+        
+        parents: Dict[str, str] = {pid: None}
+        queue = deque([pid])
+        closing = None
+        while queue:
+            current = queue.popleft()
+            waited = self.waiting_on.get(current)
+            if waited is None:
+                return None
+            for holder in self.holders.get(waited, ()):
+                if holder == pid and closing is None:
+                    closing = current
+                if holder not in parents:
+                    parents[holder] = current
+                    queue.append(holder)
+        
+        if closing is None:
+            return None
+        
+        path = [closing]
+        while path[-1] != pid:
+            path.append(parents[path[-1]])
+        path.reverse()
+        cycle = [(member, self.waiting_on[member]) for member in path]
+        return Deadlock(sorted(parents), cycle, time)
@@ -1,60 +1,126 @@
-from typing import List, Dict, Tuple
+from collections import deque
+from typing import List, Dict, Optional, Tuple
 from models.process import Process
 from models.resource import Resource
-from models.action import Action, ActionState
+from models.action import Action, ActionType, ActionState
+from algorithms.kernel import RELEASE, EventKernel, EventType
+from utils.background import progress_reporter
+from utils.profiling import active_profile
+
+class _Lock:
+    __slots__ = ('readers', 'writer', 'waiters')
+    
+    def __init__(self):
+        self.readers = 0
+        self.writer = False
+        self.waiters = deque()
+    
+    def can_enter(self, exclusive: bool) -> bool:
+        if exclusive:
+            return not self.writer and self.readers == 0
+        return not self.writer
 
 class Mutex:
+    EXCLUSIVE = 'exclusive'
+    READ_WRITE = 'read_write'
+    
     @staticmethod
     def simulate(processes: List[Process], resources: List[Resource], 
-                actions: List[Action]) -> List[Tuple[str, str, int, int, ActionState]]:
+                actions: List[Action], hold_time: Optional[int] = None,
+                mode: str = EXCLUSIVE) -> List[Tuple[str, str, int, int, ActionState]]:
+        """Simulate one lock per resource with FIFO waiters, results ordered by start time.
+        
+        An access holds the lock for ``hold_time`` cycles, or its process burst when None.
+        In READ_WRITE mode READs share the lock; a waiting writer blocks later readers.
+        """
+        if mode not in (Mutex.EXCLUSIVE, Mutex.READ_WRITE):
+            raise ValueError(f"Unknown mutex mode '{mode}'")
+        if hold_time is not None and hold_time <= 0:
+            raise ValueError(f"Hold time must be positive, got {hold_time}")
+        
         if not actions:
             return []
         
-        resource_map = {r.name: r for r in resources}
+        burst_times = {p.pid: p.burst_time for p in processes}
+        locks: Dict[str, _Lock] = {r.name: _Lock() for r in resources}
         
         sorted_actions = sorted(actions, key=lambda a: a.cycle)
         
         simulation_results = []
-        current_time = 0
+        # Releases due at a cycle run before the requests of that cycle.
+        kernel = EventKernel(EventType.ACQUIRE)
+        report = progress_reporter(len(sorted_actions))
+        profile = active_profile()
+        done = 0
         
-        for action in sorted_actions:
-            current_time = max(current_time, action.cycle)
-            
-            resource = resource_map.get(action.resource)
-            if not resource:
-                continue
-            
-            if resource.acquire(action.pid):
-                action.state = ActionState.ACCESSED
-                simulation_results.append((
-                    action.pid, 
-                    action.action_type.value, 
-                    current_time, 
-                    current_time + 1, 
-                    ActionState.ACCESSED
-                ))
-                
-                next_process = resource.release(action.pid)
-                current_time += 1
-                
-                if next_process:
-                    simulation_results.append((
-                        next_process,
-                        "GRANTED",
-                        current_time,
-                        current_time + 1,
-                        ActionState.ACCESSED
-                    ))
-                    current_time += 1
+        def is_exclusive(action: Action) -> bool:
+            return mode == Mutex.EXCLUSIVE or action.action_type == ActionType.WRITE
+        
+        def grant(lock: _Lock, action: Action, request_time: int, current_time: int) -> None:
+            action.state = ActionState.ACCESSED
+            exclusive = is_exclusive(action)
+            if exclusive:
+                lock.writer = True
             else:
-                action.state = ActionState.WAITING
+                lock.readers += 1
+            
+            if current_time > request_time:
                 simulation_results.append((
                     action.pid,
                     action.action_type.value,
+                    request_time,
                     current_time,
-                    current_time + 1,
                     ActionState.WAITING
                 ))
+            
+            end_time = current_time + (hold_time if hold_time is not None
+                                       else burst_times.get(action.pid, 1))
+            simulation_results.append((
+                action.pid,
+                action.action_type.value,
+                current_time,
+                end_time,
+                ActionState.ACCESSED
+            ))
+            kernel.schedule(end_time, RELEASE, (action.resource, exclusive))
         
+        def release(current_time: int, held: Tuple[str, bool]) -> None:
+            res_name, exclusive = held
+            lock = locks[res_name]
+            if exclusive:
+                lock.writer = False
+            else:
+                lock.readers -= 1
+            
+            while lock.waiters:
+                action, request_time = lock.waiters[0]
+                if not lock.can_enter(is_exclusive(action)):
+                    break
+                lock.waiters.popleft()
+                grant(lock, action, request_time, current_time)
+        
+        def request(current_time: int, action: Action) -> None:
+            nonlocal done
+            done += 1
+            if report:
+                report(done)
+            
+            lock = locks.get(action.resource)
+            if not lock:
+                return
+            
+            if not lock.waiters and lock.can_enter(is_exclusive(action)):
+                grant(lock, action, current_time, current_time)
+            else:
+                action.state = ActionState.WAITING
+                lock.waiters.append((action, current_time))
+                if profile is not None:
+                    profile.count('waits')
+                    profile.peak('lock_waiters_peak', len(lock.waiters))
+        
+        kernel.on(EventType.RELEASE, release).on(EventType.ACQUIRE, request)
+        kernel.follow((action.cycle, action) for action in sorted_actions)
+        kernel.run()
+        
+        simulation_results.sort(key=lambda result: result[2])
         return simulation_results
-
@@ -1,7 +1,13 @@
-from typing import List, Dict, Tuple
+from collections import deque
+from itertools import count
+from typing import List, Dict, Optional, Tuple
 from models.process import Process
 from models.resource import Resource
 from models.action import Action, ActionState
+from algorithms.synchronization.deadlock import Deadlock, WaitForGraph
+from algorithms.kernel import RELEASE, EventKernel, EventType
+from utils.background import progress_reporter
+from utils.profiling import active_profile
 
 class Semaphore:
     @staticmethod
@@ -15,15 +21,47 @@ class Semaphore:
         sorted_actions = sorted(actions, key=lambda a: a.cycle)
         
         simulation_results = []
-        current_time = 0
-        active_processes = {}  
         
-        for action in sorted_actions:
-            current_time = max(current_time, action.cycle)
+        # pid -> (resource, end_time, slot, token). A pid holds at most one
+        # resource; re-acquiring replaces the hold and keeps its slot, and the
+        # slot fixes the order in which holds due at the same step release.
+        active_processes: Dict[str, Tuple[str, int, int, int]] = {}
+        slots = count()
+        tokens = count()
+        # Holds that fell due since the last request, as (slot, token, pid).
+        # They are released when the next request is handled.
+        due = []
+        kernel = EventKernel(EventType.ACQUIRE)
+        report = progress_reporter(len(sorted_actions))
+        profile = active_profile()
+        done = 0
+        
+        def hold(pid: str, res_name: str, end_time: int) -> None:
+            entry = active_processes.get(pid)
+            slot = entry[2] if entry is not None else next(slots)
+            token = next(tokens)
+            active_processes[pid] = (res_name, end_time, slot, token)
+            kernel.schedule(end_time, RELEASE, (slot, token, pid))
+        
+        def expire(current_time: int, held: Tuple[int, int, str]) -> None:
+            entry = active_processes.get(held[2])
+            if entry is not None and entry[3] == held[1]:
+                due.append(held)
+        
+        def request(current_time: int, action: Action) -> None:
+            nonlocal done
+            done += 1
+            if report:
+                report(done)
             
-            completed = []
-            for pid, (res_name, end_time) in active_processes.items():
-                if end_time <= current_time:
+            if due:
+                due.sort()
+                completed = []
+                for _, token, pid in due:
+                    res_name, _, _, current_token = active_processes[pid]
+                    if current_token != token:
+                        continue
+                    
                     resource = resource_map[res_name]
                     next_process = resource.release(pid)
                     completed.append(pid)
@@ -36,14 +74,15 @@ class Semaphore:
                             current_time + 1,
                             ActionState.ACCESSED
                         ))
-                        active_processes[next_process] = (res_name, current_time + 1)
-            
-            for pid in completed:
-                del active_processes[pid]
+                        hold(next_process, res_name, current_time + 1)
+                
+                for pid in completed:
+                    del active_processes[pid]
+                due.clear()
             
             resource = resource_map.get(action.resource)
             if not resource:
-                continue
+                return
             
             if resource.acquire(action.pid):
                 action.state = ActionState.ACCESSED
@@ -54,7 +93,7 @@ class Semaphore:
                     current_time + 1,
                     ActionState.ACCESSED
                 ))
-                active_processes[action.pid] = (action.resource, current_time + 1)
+                hold(action.pid, action.resource, current_time + 1)
             else:
                 action.state = ActionState.WAITING
                 simulation_results.append((
@@ -64,6 +103,129 @@ class Semaphore:
                     current_time + 1,
                     ActionState.WAITING
                 ))
+                if profile is not None:
+                    profile.count('waits')
+        
+        kernel.on(EventType.RELEASE, expire).on(EventType.ACQUIRE, request)
+        kernel.follow((action.cycle, action) for action in sorted_actions)
+        kernel.run()
         
         return simulation_results
-
+    
+    @staticmethod
+    def simulate_hold_and_wait(processes: List[Process], resources: List[Resource],
+                               actions: List[Action]
+                               ) -> Tuple[List[Tuple[str, str, int, int, ActionState]],
+                                          Optional[Deadlock]]:
+        """Semaphore run where blocked processes keep their holds; stops at the first deadlock.
+        
+        Returns the results up to that point and the Deadlock, or None.
+        """
+        if not actions:
+            return [], None
+        
+        resource_map = {r.name: r for r in resources}
+        
+        sorted_actions = sorted(actions, key=lambda a: a.cycle)
+        
+        simulation_results = []
+        graph = WaitForGraph()
+        kernel = EventKernel(EventType.ACQUIRE)
+        report = progress_reporter(len(sorted_actions))
+        profile = active_profile()
+        done = 0
+        deadlock = None
+        blocked: Dict[str, str] = {}
+        deferred_holds: Dict[str, List[str]] = {}
+        pending: Dict[str, deque] = {}
+        
+        def hold(pid: str, res_name: str, end_time: int) -> None:
+            graph.add_hold(pid, res_name)
+            kernel.schedule(end_time, RELEASE, (pid, res_name))
+        
+        def request(action: Action, current_time: int) -> Optional[Deadlock]:
+            resource = resource_map.get(action.resource)
+            if not resource:
+                return None
+            
+            if resource.acquire(action.pid):
+                action.state = ActionState.ACCESSED
+                simulation_results.append((
+                    action.pid,
+                    action.action_type.value,
+                    current_time,
+                    current_time + 1,
+                    ActionState.ACCESSED
+                ))
+                hold(action.pid, action.resource, current_time + 1)
+                return None
+            
+            action.state = ActionState.WAITING
+            simulation_results.append((
+                action.pid,
+                action.action_type.value,
+                current_time,
+                current_time + 1,
+                ActionState.WAITING
+            ))
+            blocked[action.pid] = action.resource
+            if profile is not None:
+                profile.count('waits')
+                profile.peak('blocked_peak', len(blocked))
+            return graph.block(action.pid, action.resource, current_time)
+        
+        def wake(pid: str, res_name: str, current_time: int) -> Optional[Deadlock]:
+            del blocked[pid]
+            graph.unblock(pid)
+            simulation_results.append((
+                pid,
+                "GRANTED",
+                current_time,
+                current_time + 1,
+                ActionState.ACCESSED
+            ))
+            hold(pid, res_name, current_time + 1)
+            for held in deferred_holds.pop(pid, ()):
+                kernel.schedule(current_time + 1, RELEASE, (pid, held))
+            
+            queued = pending.get(pid)
+            while queued and pid not in blocked:
+                deadlock = request(queued.popleft(), current_time)
+                if deadlock:
+                    return deadlock
+            return None
+        
+        def stop_at(found: Optional[Deadlock]) -> None:
+            nonlocal deadlock
+            if found:
+                deadlock = found
+                kernel.stop()
+                if profile is not None:
+                    profile.count('deadlocks')
+        
+        def release(current_time: int, held: Tuple[str, str]) -> None:
+            pid, res_name = held
+            if pid in blocked:
+                deferred_holds.setdefault(pid, []).append(res_name)
+                return
+            
+            graph.remove_hold(pid, res_name)
+            next_process = resource_map[res_name].transfer(pid)
+            if next_process:
+                stop_at(wake(next_process, res_name, current_time))
+        
+        def arrive(current_time: int, action: Action) -> None:
+            nonlocal done
+            done += 1
+            if report:
+                report(done)
+            
+            if action.pid in blocked:
+                pending.setdefault(action.pid, deque()).append(action)
+                return
+            stop_at(request(action, current_time))
+        
+        kernel.on(EventType.RELEASE, release).on(EventType.ACQUIRE, arrive)
+        kernel.follow((action.cycle, action) for action in sorted_actions)
+        kernel.run()
+        return simulation_results, deadlock
@@ -0,0 +1,348 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from typing import Dict, List, Optional, TextIO
+
+from utils.benchmark import (BENCH_FIELDS, BENCHMARKS, SIZES, compare, load_baseline,
+                             run_benchmarks, save_baseline)
+from utils.file_loader import FileLoader, FileValidationError
+from utils.generator import (ARRIVALS, BURSTS, write_actions, write_processes,
+                             write_resources)
+from utils.metrics import SCHEDULE_METRICS
+from utils.profiling import Profile, phase, profiling
+from utils.runner import (GLOBAL_QUEUE, QUEUE_MODES, SCHEDULERS, SYNCHRONIZERS,
+                          normalize_name, run_schedule, run_synchronization)
+from utils.schedule_cache import ScheduleCache, workload_hash
+from utils.sweep import SWEEP_FIELDS, sweep
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORKLOADS = os.path.join(BASE_DIR, 'inputs', 'scheduling', '*.txt')
+DEFAULT_SYNC_DIR = os.path.join(BASE_DIR, 'inputs', 'synchronization')
+
+METRIC_FIELDS = ['workload', 'algorithm', 'quantum', 'cores'] + SCHEDULE_METRICS
+SYNC_FIELDS = ['workload', 'mechanism', 'events', 'accessed', 'waiting', 'makespan',
+               'deadlocked_pids']
+
+def split_names(values: List[str]) -> List[str]:
+    return [name for value in values for name in value.split(',') if name.strip()]
+
+def scheduling_records(args: argparse.Namespace) -> List[Dict[str, object]]:
+    workloads = args.workloads or sorted(glob.glob(DEFAULT_WORKLOADS))
+    algorithms = split_names(args.algorithms)
+    cache = ScheduleCache(directory=args.cache)
+    records = []
+
+    for workload in workloads:
+        with phase('load'):
+            processes = FileLoader.load_processes(workload)
+        with phase('hash'):
+            content = workload_hash(processes)
+        for algorithm in algorithms:
+            quanta = args.quantum if normalize_name(algorithm, SCHEDULERS) == 'RR' else [None]
+            for quantum in quanta:
+                for cores in args.cores:
+                    result = run_schedule(processes, algorithm, quantum, cache, content, cores,
+                                          args.queues, args.steal)
+                    schedule = result['schedule']
+                    record = {'workload': workload}
+                    record.update(result)
+                    record['schedule'] = [list(segment) for segment in (
+                        schedule.tagged() if schedule.cores > 1 else schedule)]
+                    record['processes'] = [{
+                        'pid': p.pid,
+                        'burst_time': p.burst_time,
+                        'arrival_time': p.arrival_time,
+                        'priority': p.priority,
+                        'start_time': p.start_time,
+                        'completion_time': p.completion_time,
+                        'waiting_time': p.waiting_time,
+                        'turnaround_time': p.turnaround_time,
+                    } for p in result['processes']]
+                    records.append(record)
+
+    return records
+
+def sweep_records(args: argparse.Namespace) -> List[Dict[str, object]]:
+    workloads = args.workloads or sorted(glob.glob(DEFAULT_WORKLOADS))
+    tables = {workload: FileLoader.load_process_table(workload) for workload in workloads}
+    return sweep(tables, split_names(args.algorithms), args.quantum, args.jobs, args.cache,
+                 args.cores, args.queues, args.steal)
+
+def synchronization_records(args: argparse.Namespace) -> List[Dict[str, object]]:
+    with phase('load'):
+        processes = FileLoader.load_processes(args.processes)
+        resources = FileLoader.load_resources(args.resources)
+        actions = FileLoader.load_actions(args.actions)
+    records = []
+
+    for mechanism in split_names(args.mechanisms):
+        result = run_synchronization(processes, resources, actions, mechanism, args.hold,
+                                     args.hold_and_wait)
+        record = {'workload': args.actions}
+        record.update(result)
+        deadlock = result['deadlock']
+        if deadlock is not None:
+            record['deadlock'] = {'pids': deadlock.pids, 'cycle': deadlock.cycle,
+                                  'time': deadlock.time}
+        record['deadlocked_pids'] = ' '.join(deadlock.pids) if deadlock else ''
+        record['results'] = [[pid, action, start, end, state.value]
+                             for pid, action, start, end, state in result['results']]
+        records.append(record)
+
+    return records
+
+def benchmark_records(args: argparse.Namespace) -> List[Dict[str, object]]:
+    def report(record: Dict[str, object]) -> None:
+        if record['status'] == 'skipped':
+            print(f"{record['benchmark']:>10} {record['size']:>9}  omitido", file=sys.stderr)
+        else:
+            print(f"{record['benchmark']:>10} {record['size']:>9}  {record['seconds']:.4f} s",
+                  file=sys.stderr)
+
+    names = [normalize_name(name, BENCHMARKS) for name in split_names(args.benchmarks)]
+    records = run_benchmarks(names, args.sizes, args.arrival, args.burst, args.seed,
+                             args.quantum, args.repeat, not args.no_memory, args.budget,
+                             report)
+    if args.save:
+        save_baseline(records, args.save)
+    if args.baseline:
+        regressions = compare(records, load_baseline(args.baseline), args.tolerance)
+        for record in regressions:
+            print(f"Regresión: {record['benchmark']} n={record['size']} "
+                  f"{record['ratio']:.2f}x más lento", file=sys.stderr)
+    return records
+
+def parse_weights(text: str) -> List[float]:
+    try:
+        return [float(weight) for weight in text.split(',')]
+    except ValueError:
+        raise ValueError(f"Pesos de prioridad inválidos: {text}")
+
+def generate_files(args: argparse.Namespace) -> None:
+    binary = True if args.binary else None
+    if args.kind == 'processes':
+        weights = parse_weights(args.priority_mix) if args.priority_mix else None
+        count = write_processes(args.output, args.count, binary, arrival=args.arrival,
+                                burst=args.burst, mean_burst=args.mean_burst, load=args.load,
+                                priorities=args.priorities, priority_weights=weights,
+                                seed=args.seed)
+    elif args.kind == 'actions':
+        count = write_actions(args.output, args.count, args.processes, args.resources, binary,
+                              arrival=args.arrival, mean_gap=args.mean_gap,
+                              write_ratio=args.write_ratio, hotspot=args.hotspot,
+                              hot_resources=args.hot_resources, seed=args.seed)
+    else:
+        count = write_resources(args.output, args.count, args.max_units)
+    print(f"{count} registros escritos en {args.output}", file=sys.stderr)
+
+def write_records(records: List[Dict[str, object]], fields: List[str], output_format: str,
+                  stream: TextIO, profile: Optional[Profile] = None) -> None:
+    if output_format == 'json':
+        document = {'runs': records}
+        if profile is not None:
+            document['profile'] = profile.as_dict()
+        json.dump(document, stream, indent=2, ensure_ascii=False)
+        stream.write('\n')
+    else:
+        writer = csv.DictWriter(stream, fieldnames=fields, extrasaction='ignore',
+                                lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(records)
+
+def write_segments(records: List[Dict[str, object]], path: str) -> None:
+    """Write one CSV row per segment; multi-core runs add the cores and core columns."""
+    multicore = any(record['cores'] > 1 for record in records)
+    with open(path, 'w', encoding='utf-8', newline='') as stream:
+        writer = csv.writer(stream, lineterminator='\n')
+        header = ['workload', 'algorithm', 'quantum', 'pid', 'start', 'end']
+        writer.writerow(header + ['cores', 'core'] if multicore else header)
+        for record in records:
+            prefix = [record['workload'], record['algorithm'], record['quantum']]
+            for segment in record['schedule']:
+                row = prefix + segment[:3]
+                if multicore:
+                    row += [record['cores'], segment[3] if len(segment) > 3 else 0]
+                writer.writerow(row)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='simulador', description="Ejecuta simulaciones sin interfaz gráfica")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Calendarización de procesos")
+    run.add_argument('workloads', nargs='*',
+                     help="Archivos de procesos (.txt o .trace); por defecto inputs/scheduling/*.txt")
+    run.add_argument('-a', '--algorithms', nargs='+', default=[','.join(SCHEDULERS)],
+                     help=f"Algoritmos separados por comas: {', '.join(SCHEDULERS)}")
+    run.add_argument('-q', '--quantum', nargs='+', type=int, default=[2],
+                     help="Valores de quantum para Round Robin")
+    run.add_argument('-c', '--cores', nargs='+', type=int, default=[1],
+                     help="Cantidad de núcleos; con más de uno se simula un multiprocesador")
+    run.add_argument('--queues', choices=QUEUE_MODES, default=GLOBAL_QUEUE,
+                     help="Cola de listos global o una por núcleo")
+    run.add_argument('--steal', action='store_true',
+                     help="Con colas por núcleo, los núcleos ociosos roban trabajo")
+    run.add_argument('-f', '--format', choices=['json', 'csv'], default='json')
+    run.add_argument('-o', '--output', help="Archivo de salida; por defecto la salida estándar")
+    run.add_argument('--segments', help="Escribe además los segmentos en este archivo CSV")
+    run.add_argument('--cache', help="Directorio donde se guardan y reutilizan las calendarizaciones")
+    run.add_argument('--profile', action='store_true',
+                     help="Mide el tiempo de cada fase y cuenta eventos de los motores; el "
+                          "resumen va a la salida de error")
+
+    sweep_parser = commands.add_parser('sweep', help="Barrido de algoritmos y quantum en paralelo")
+    sweep_parser.add_argument('workloads', nargs='*',
+                              help="Archivos de procesos; por defecto inputs/scheduling/*.txt")
+    sweep_parser.add_argument('-a', '--algorithms', nargs='+', default=[','.join(SCHEDULERS)],
+                              help=f"Algoritmos separados por comas: {', '.join(SCHEDULERS)}")
+    sweep_parser.add_argument('-q', '--quantum', nargs='+', type=int, default=[2],
+                              help="Valores de quantum para Round Robin")
+    sweep_parser.add_argument('-c', '--cores', nargs='+', type=int, default=[1],
+                              help="Cantidad de núcleos; con más de uno se simula un multiprocesador")
+    sweep_parser.add_argument('--queues', choices=QUEUE_MODES, default=GLOBAL_QUEUE,
+                              help="Cola de listos global o una por núcleo")
+    sweep_parser.add_argument('--steal', action='store_true',
+                              help="Con colas por núcleo, los núcleos ociosos roban trabajo")
+    sweep_parser.add_argument('-j', '--jobs', type=int,
+                              help="Procesos de trabajo; por defecto uno por núcleo")
+    sweep_parser.add_argument('--cache',
+                              help="Directorio donde se guardan y reutilizan las calendarizaciones")
+    sweep_parser.add_argument('-f', '--format', choices=['json', 'csv'], default='csv')
+    sweep_parser.add_argument('-o', '--output', help="Archivo de salida; por defecto la salida estándar")
+
+    sync = commands.add_parser('sync', help="Sincronización de procesos")
+    sync.add_argument('-p', '--processes', default=os.path.join(DEFAULT_SYNC_DIR, 'process.txt'))
+    sync.add_argument('-r', '--resources', default=os.path.join(DEFAULT_SYNC_DIR, 'resources.txt'))
+    sync.add_argument('-c', '--actions', default=os.path.join(DEFAULT_SYNC_DIR, 'actions.txt'))
+    sync.add_argument('-m', '--mechanisms', nargs='+', default=[','.join(SYNCHRONIZERS)],
+                      help=f"Mecanismos separados por comas: {', '.join(SYNCHRONIZERS)}")
+    sync.add_argument('--hold', type=int,
+                      help="Ciclos que cada acceso retiene el mutex; por defecto la ráfaga del proceso")
+    sync.add_argument('--hold-and-wait', action='store_true',
+                      help="Semáforo: los procesos bloqueados retienen sus recursos y se "
+                           "detectan interbloqueos")
+    sync.add_argument('--profile', action='store_true',
+                      help="Mide el tiempo de cada fase y cuenta eventos de los motores; el "
+                           "resumen va a la salida de error")
+    sync.add_argument('-f', '--format', choices=['json', 'csv'], default='json')
+    sync.add_argument('-o', '--output', help="Archivo de salida; por defecto la salida estándar")
+
+    bench = commands.add_parser('bench', help="Mide tiempo y memoria con cargas sintéticas")
+    bench.add_argument('-b', '--benchmarks', nargs='+', default=[','.join(BENCHMARKS)],
+                       help=f"Pruebas separadas por comas: {', '.join(BENCHMARKS)}")
+    bench.add_argument('-n', '--sizes', nargs='+', type=int, default=list(SIZES),
+                       help="Cantidad de procesos (o de acciones en MUTEX y SEMAPHORE)")
+    bench.add_argument('--arrival', choices=ARRIVALS, default='poisson',
+                       help="Distribución de llegadas")
+    bench.add_argument('--burst', choices=BURSTS, default='exponential',
+                       help="Distribución de ráfagas")
+    bench.add_argument('--seed', type=int, default=0)
+    bench.add_argument('-q', '--quantum', type=int, default=2, help="Quantum para Round Robin")
+    bench.add_argument('--repeat', type=int, default=3, help="Repeticiones; se reporta la mejor")
+    bench.add_argument('--budget', type=float, default=60.0,
+                       help="Segundos tras los cuales se omiten los tamaños mayores")
+    bench.add_argument('--no-memory', action='store_true', help="No mide el pico de memoria")
+    bench.add_argument('--save', help="Guarda los resultados como línea base JSON")
+    bench.add_argument('--baseline', help="Compara contra una línea base JSON")
+    bench.add_argument('--tolerance', type=float, default=0.25,
+                       help="Fracción de tiempo extra tolerada antes de marcar una regresión")
+    bench.add_argument('-f', '--format', choices=['json', 'csv'], default='csv')
+    bench.add_argument('-o', '--output', help="Archivo de salida; por defecto la salida estándar")
+
+    generate = commands.add_parser('generate', help="Genera cargas de trabajo sintéticas")
+    generate.add_argument('kind', choices=['processes', 'actions', 'resources'])
+    generate.add_argument('output', help="Archivo de salida; con extensión .trace se usa el "
+                                         "formato binario")
+    generate.add_argument('-n', '--count', type=int, required=True, help="Cantidad de registros")
+    generate.add_argument('--seed', type=int, default=0, help="Semilla; la misma semilla "
+                                                              "produce el mismo archivo")
+    generate.add_argument('--binary', action='store_true',
+                          help="Escribe el formato binario de traza sin importar la extensión")
+    generate.add_argument('--arrival', choices=ARRIVALS, default='poisson',
+                          help="Distribución de llegadas (procesos) o de ciclos (acciones)")
+    generate.add_argument('--burst', choices=BURSTS, default='exponential',
+                          help="Distribución de ráfagas; pareto produce colas pesadas")
+    generate.add_argument('--mean-burst', type=float, default=5, help="Ráfaga media")
+    generate.add_argument('--load', type=float, default=0.9,
+                          help="Carga ofrecida a la CPU; fija el espaciado de las llegadas")
+    generate.add_argument('--priorities', type=int, default=5,
+                          help="Niveles de prioridad, elegidos de forma uniforme")
+    generate.add_argument('--priority-mix',
+                          help="Pesos por prioridad separados por comas, p. ej. 70,20,10")
+    generate.add_argument('--processes', type=int, default=100,
+                          help="Procesos a los que se reparten las acciones")
+    generate.add_argument('--resources', type=int, default=8,
+                          help="Recursos a los que se reparten las acciones")
+    generate.add_argument('--mean-gap', type=float, default=1,
+                          help="Ciclos promedio entre acciones")
+    generate.add_argument('--write-ratio', type=float, default=0.3,
+                          help="Fracción de acciones WRITE")
+    generate.add_argument('--hotspot', type=float, default=0.0,
+                          help="Fracción de acciones dirigidas a los recursos calientes")
+    generate.add_argument('--hot-resources', type=int, default=1,
+                          help="Cantidad de recursos calientes (R1..Rk)")
+    generate.add_argument('--max-units', type=int, default=2,
+                          help="Unidades máximas por recurso")
+
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    profile = Profile() if getattr(args, 'profile', False) else None
+
+    try:
+        with profiling(profile):
+            if args.command == 'run':
+                if any(q <= 0 for q in args.quantum):
+                    raise ValueError("El quantum debe ser positivo")
+                if any(cores <= 0 for cores in args.cores):
+                    raise ValueError("La cantidad de núcleos debe ser positiva")
+                records = scheduling_records(args)
+                fields = METRIC_FIELDS
+            elif args.command == 'sweep':
+                if any(q <= 0 for q in args.quantum):
+                    raise ValueError("El quantum debe ser positivo")
+                if any(cores <= 0 for cores in args.cores):
+                    raise ValueError("La cantidad de núcleos debe ser positiva")
+                records = sweep_records(args)
+                fields = SWEEP_FIELDS
+            elif args.command == 'sync':
+                if args.hold is not None and args.hold <= 0:
+                    raise ValueError("La duración de acceso debe ser positiva")
+                records = synchronization_records(args)
+                fields = SYNC_FIELDS
+            elif args.command == 'generate':
+                generate_files(args)
+                return 0
+            else:
+                if any(size <= 0 for size in args.sizes):
+                    raise ValueError("Los tamaños deben ser positivos")
+                records = benchmark_records(args)
+                fields = BENCH_FIELDS
+    except (FileValidationError, ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    with profiling(profile), phase('output'):
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8', newline='') as stream:
+                write_records(records, fields, args.format, stream, profile)
+        else:
+            write_records(records, fields, args.format, sys.stdout, profile)
+
+        if args.command == 'run' and args.segments:
+            write_segments(records, args.segments)
+
+    if profile is not None:
+        print(profile.describe(), file=sys.stderr)
+
+    if args.command == 'bench' and any(record['status'] == 'regression' for record in records):
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,56 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Tuple
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from models.schedule import CoreSchedule, Schedule
+from models.interval_index import IntervalIndex
+
+# Pixels per cycle, from finest to coarsest.
+ZOOM_LEVELS = (60, 30, 15, 8, 4, 2, 1, 0.5, 0.2, 0.1, 0.05, 0.02, 0.01, 0.005, 0.002, 0.001)
+DEFAULT_ZOOM = 1
+# Below this many pixels per cycle, segments are merged into aggregated bars.
+DETAIL_SCALE = 4
+MIN_BAR_WIDTH = 3
+MIN_LABEL_SPACING = 25
+MIN_TEXT_WIDTH = 24
+GRID_STEPS = (1, 2, 5)
+
+class _Row:
+    """One Gantt row: its y position, its segments and an interval index over them."""
+    
+    __slots__ = ('y', 'starts', 'ends', 'process_ids', 'index')
+    
+    def __init__(self, y: int):
+        self.y = y
+        self.starts = array('i')
+        self.ends = array('i')
+        self.process_ids: List[str] = []
+        self.index: Optional[IntervalIndex] = None
+    
+    def finish(self) -> None:
+        self.index = IntervalIndex(self.starts, self.ends)
 
 class GanttChart:
     def __init__(self, parent):
         self.parent = parent
         self.colors = {}
+        self.block_height = 40
+        self.block_spacing = 5
+        self.zoom_index = DEFAULT_ZOOM
+        self.time_scale = ZOOM_LEVELS[DEFAULT_ZOOM]
+        self.start_x = 50
+        self.start_y = 50
+        self._animation_job = None
+        self._render_job = None
+        self._rows: Dict[str, _Row] = {}
+        self._row_items: List[Tuple[str, _Row]] = []
+        self._row_ys = array('i')
+        self._max_time = 0
+        self._clip_time: Optional[int] = None
+        self._cursor = None
+        self._running = []
         self.setup_ui()
     
     def setup_ui(self):
@@ -15,20 +60,28 @@ class GanttChart:
         self.canvas = tk.Canvas(self.main_frame, bg='white', height=200)
         
         h_scrollbar = ttk.Scrollbar(self.main_frame, orient=tk.HORIZONTAL, 
-                                   command=self.canvas.xview)
+                                   command=self.xview)
         v_scrollbar = ttk.Scrollbar(self.main_frame, orient=tk.VERTICAL, 
-                                   command=self.canvas.yview)
+                                   command=self.yview)
         
         self.canvas.configure(xscrollcommand=h_scrollbar.set, 
                              yscrollcommand=v_scrollbar.set)
+        self.canvas.bind('<Configure>', lambda event: self.request_render())
         
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.time_label = ttk.Label(self.main_frame, text="Ciclo: 0", 
+        controls = ttk.Frame(self.main_frame)
+        controls.pack(side=tk.TOP, pady=5)
+        
+        self.time_label = ttk.Label(controls, text="Ciclo: 0",
                                    font=('Arial', 12, 'bold'))
-        self.time_label.pack(side=tk.TOP, pady=5)
+        self.time_label.pack(side=tk.TOP, pady=(0, 5))
+        ttk.Button(controls, text="+", width=3,
+                  command=lambda: self.set_zoom(self.zoom_index - 1)).pack(side=tk.LEFT)
+        ttk.Button(controls, text="−", width=3,
+                  command=lambda: self.set_zoom(self.zoom_index + 1)).pack(side=tk.LEFT)
     
     def get_color(self, process_id: str) -> str:
         base_colors = {
@@ -49,101 +102,347 @@ class GanttChart:
             return self.colors[process_id]
     
     def clear(self):
+        self.stop_animation()
         self.canvas.delete("all")
         self.colors.clear()
+        self._set_rows({})
+        self._max_time = 0
+        self._clip_time = None
+        self._cursor = None
+        self._running = []
         self.time_label.config(text="Ciclo: 0")
     
-    def draw_schedule(self, schedule: List[Tuple], current_time: int = None):
-        self.canvas.delete("all")
-        
-        if not schedule:
+    @property
+    def animating(self) -> bool:
+        return self._animation_job is not None
+    
+    def stop_animation(self):
+        if self._animation_job is not None:
+            self.parent.after_cancel(self._animation_job)
+            self._animation_job = None
+    
+    def xview(self, *args):
+        self.canvas.xview(*args)
+        self.request_render()
+    
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self.request_render()
+    
+    def request_render(self):
+        if self._render_job is None and self._rows:
+            self._render_job = self.parent.after_idle(self._render_pending)
+    
+    def _render_pending(self):
+        self._render_job = None
+        self.render_viewport()
+    
+    def set_zoom(self, zoom_index: int):
+        zoom_index = max(0, min(zoom_index, len(ZOOM_LEVELS) - 1))
+        if zoom_index == self.zoom_index:
             return
         
-        block_height = 40
-        block_spacing = 5
-        time_scale = 30
-        start_x = 50
-        start_y = 50
+        center = self._x_to_time(self.canvas.canvasx(self.canvas.winfo_width() / 2))
+        self.zoom_index = zoom_index
+        self.time_scale = ZOOM_LEVELS[zoom_index]
+        
+        if self._rows:
+            self._update_scrollregion()
+            width = self._time_to_x(self._max_time) + self.start_x
+            left = self._time_to_x(center) - self.canvas.winfo_width() / 2
+            self.canvas.xview_moveto(max(0.0, left / width))
+            self.render_viewport()
+    
+    def _time_to_x(self, time: float) -> float:
+        return self.start_x + time * self.time_scale
+    
+    def _x_to_time(self, x: float) -> float:
+        return (x - self.start_x) / self.time_scale
+    
+    def _visible_window(self) -> Tuple[float, float]:
+        left = self.canvas.canvasx(0)
+        right = self.canvas.canvasx(self.canvas.winfo_width())
+        return self._x_to_time(left), self._x_to_time(right)
+    
+    def _visible_rows(self) -> List[Tuple[str, _Row]]:
+        """Rows whose bars intersect the visible band of the canvas."""
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = bisect_right(self._row_ys, top - self.block_height)
+        last = bisect_left(self._row_ys, bottom)
+        return self._row_items[first:last]
+    
+    def _set_rows(self, rows: Dict[str, _Row]):
+        # Rows are laid out top to bottom in insertion order.
+        self._rows = rows
+        self._row_items = list(rows.items())
+        self._row_ys = array('i', (row.y for row in rows.values()))
+    
+    def _schedule_max_time(self, schedule) -> int:
+        if isinstance(schedule, Schedule):
+            return schedule.makespan()
+        return max(end for _, _, end in schedule) if schedule else 10
+    
+    def _index_rows(self, schedule) -> Dict[str, _Row]:
+        if isinstance(schedule, CoreSchedule):
+            return self._index_lanes(schedule)
+        
+        rows = {}
+        current_y = self.start_y
+        for process_id, start_time, end_time in schedule:
+            base_pid = process_id.split('_')[0]
+            row = rows.get(base_pid)
+            if row is None:
+                row = rows[base_pid] = _Row(current_y)
+                current_y += self.block_height + self.block_spacing
+            row.starts.append(start_time)
+            row.ends.append(end_time)
+            row.process_ids.append(process_id)
+        for row in rows.values():
+            row.finish()
+        return rows
+    
+    def _index_lanes(self, schedule: CoreSchedule) -> Dict[str, _Row]:
+        """One row per core of a multi-core schedule, idle cores included."""
+        step = self.block_height + self.block_spacing
+        lanes = [_Row(self.start_y + core * step) for core in range(schedule.cores)]
+        for process_id, start_time, end_time, core in schedule.tagged():
+            lane = lanes[core]
+            lane.starts.append(start_time)
+            lane.ends.append(end_time)
+            lane.process_ids.append(process_id)
+        for lane in lanes:
+            lane.finish()
+        return {f"CPU {core}": lane for core, lane in enumerate(lanes)}
+    
+    def _rows_bottom(self) -> int:
+        return self.start_y + len(self._rows) * (self.block_height + self.block_spacing)
+    
+    def _update_scrollregion(self):
+        right = self._time_to_x(self._max_time) + self.start_x
+        bottom = max(self._rows_bottom(), self.start_y + 200) + 10
+        self.canvas.configure(scrollregion=(0, 0, right, bottom))
+    
+    def _draw_frame(self):
+        """Draw the legend, which does not depend on the viewport."""
+        self.canvas.create_text(self.start_x, 20, text="🟢 Acceso Exitoso",
+                               font=('Arial', 10), anchor='w', fill='green', tags='frame')
+        self.canvas.create_text(self.start_x + 150, 20, text="🔴 En Espera",
+                               font=('Arial', 10), anchor='w', fill='red', tags='frame')
+    
+    def _grid_step(self) -> int:
+        magnitude = 1
+        while True:
+            for step in GRID_STEPS:
+                if step * magnitude * self.time_scale >= MIN_LABEL_SPACING:
+                    return step * magnitude
+            magnitude *= 10
+    
+    def _draw_grid(self, first_time: float, last_time: float):
+        step = self._grid_step()
+        first = max(0, int(first_time) // step * step)
+        last = min(self._max_time, int(last_time) + 1)
+        for i in range(first, last + 1, step):
+            x = self._time_to_x(i)
+            self.canvas.create_line(x, self.start_y - 10, x, self.start_y + 200,
+                                   fill='lightgray', dash=(2, 2), tags='view')
+            self.canvas.create_text(x, self.start_y - 15, text=str(i),
+                                   font=('Arial', 8), tags='view')
+    
+    def _create_segment(self, process_id: str, start_time: int, end_time: int,
+                        y: int) -> Tuple[int, ...]:
+        base_pid = process_id.split('_')[0]
+        x1 = self._time_to_x(start_time)
+        x2 = self._time_to_x(end_time)
         
-        self.canvas.create_text(start_x, 20, text="🟢 Acceso Exitoso", 
-                               font=('Arial', 10), anchor='w', fill='green')
-        self.canvas.create_text(start_x + 150, 20, text="🔴 En Espera", 
-                               font=('Arial', 10), anchor='w', fill='red')
+        color = self.get_color(process_id)
         
-        max_time = max(end for _, _, end in schedule) if schedule else 10
+        if "WAITING" in process_id or "_ESPERA" in process_id:
+            rectangle = self.canvas.create_rectangle(x1, y, x2, y + self.block_height, 
+                                                     fill=color, outline='red', width=2,
+                                                     stipple='gray50', tags='view')
+            text_color = 'white'
+            status_text = "WAIT"
+        else:
+            rectangle = self.canvas.create_rectangle(x1, y, x2, y + self.block_height, 
+                                                     fill=color, outline='green', width=2,
+                                                     tags='view')
+            text_color = 'black'
+            status_text = "OK"
         
-        for i in range(max_time + 1):
-            x = start_x + i * time_scale
-            self.canvas.create_line(x, start_y - 10, x, start_y + 200, 
-                                   fill='lightgray', dash=(2, 2))
-            self.canvas.create_text(x, start_y - 15, text=str(i), 
-                                   font=('Arial', 8))
+        if x2 - x1 < MIN_TEXT_WIDTH:
+            return (rectangle,)
         
-        y_positions = {}
-        current_y = start_y
+        label = self.canvas.create_text((x1 + x2) / 2, y + self.block_height / 2 - 5, 
+                                       text=base_pid, font=('Arial', 9, 'bold'),
+                                       fill=text_color, tags='view')
+        status = self.canvas.create_text((x1 + x2) / 2, y + self.block_height / 2 + 5, 
+                                        text=status_text, font=('Arial', 8),
+                                        fill=text_color, tags='view')
+        return rectangle, label, status
+    
+    def _resize_segment(self, items: Tuple[int, ...], process_id: str, start_time: int,
+                        end_time: int, y: int) -> Tuple[int, ...]:
+        x1 = self._time_to_x(start_time)
+        x2 = self._time_to_x(end_time)
+        if len(items) == 1 and x2 - x1 >= MIN_TEXT_WIDTH:
+            self.canvas.delete(items[0])
+            return self._create_segment(process_id, start_time, end_time, y)
         
-        for process_id, start_time, end_time in schedule:
-            base_pid = process_id.split('_')[0] 
-            
-            if base_pid not in y_positions:
-                y_positions[base_pid] = current_y
-                current_y += block_height + block_spacing
-            
-            y = y_positions[base_pid]
-            x1 = start_x + start_time * time_scale
-            x2 = start_x + end_time * time_scale
-            
-            color = self.get_color(process_id)
+        self.canvas.coords(items[0], x1, y, x2, y + self.block_height)
+        if len(items) == 3:
+            self.canvas.coords(items[1], (x1 + x2) / 2, y + self.block_height / 2 - 5)
+            self.canvas.coords(items[2], (x1 + x2) / 2, y + self.block_height / 2 + 5)
+        return items
+    
+    def _draw_row_detail(self, row: _Row, first_time: float, last_time: float,
+                         clip_time: Optional[int]):
+        starts, ends, process_ids = row.starts, row.ends, row.process_ids
+        if clip_time is not None:
+            last_time = min(last_time, clip_time)
+        for i in row.index.overlapping(first_time, last_time):
+            end_time = ends[i] if clip_time is None else min(ends[i], clip_time)
+            items = self._create_segment(process_ids[i], starts[i], end_time, row.y)
+            if clip_time is not None and ends[i] > clip_time:
+                self._running.append((process_ids[i], starts[i], ends[i], row.y, items))
+    
+    def _draw_row_aggregated(self, row: _Row, first_time: float, last_time: float,
+                             clip_time: Optional[int]):
+        """Merge segments closer than MIN_BAR_WIDTH pixels into single bars."""
+        index = row.index
+        starts, max_ends = index.starts, index.max_ends
+        gap = MIN_BAR_WIDTH / self.time_scale
+        limit = last_time if clip_time is None else min(last_time, clip_time)
+        i = index.first_ending_after(first_time)
+        count = len(starts)
+        while i < count and starts[i] < limit:
+            bar_start = starts[i]
+            j = i + 1
+            bar_end = max_ends[i]
+            while True:
+                k = bisect_left(starts, min(bar_end + gap, limit), j)
+                if k == j:
+                    break
+                j = k
+                bar_end = max_ends[j - 1]
+            if clip_time is not None:
+                bar_end = min(bar_end, clip_time)
             
-            if "WAITING" in process_id or "_ESPERA" in process_id:
-                self.canvas.create_rectangle(x1, y, x2, y + block_height, 
-                                           fill=color, outline='red', width=2,
-                                           stipple='gray50')
-                text_color = 'white'
-                status_text = "WAIT"
+            process_id = row.process_ids[index.order[i]]
+            waiting = "WAITING" in process_id or "_ESPERA" in process_id
+            self.canvas.create_rectangle(self._time_to_x(bar_start), row.y,
+                                         self._time_to_x(bar_end), row.y + self.block_height,
+                                         fill=self.get_color(process_id), width=1,
+                                         outline='red' if waiting else 'green', tags='view')
+            i = j
+    
+    def render_viewport(self):
+        """Redraw the grid, labels and segments of the visible rows and window."""
+        self.canvas.delete('view')
+        self._running = []
+        if not self._rows:
+            return
+        
+        first_time, last_time = self._visible_window()
+        self._draw_grid(first_time, last_time)
+        
+        clip_time = self._clip_time
+        detailed = self.time_scale >= DETAIL_SCALE
+        for base_pid, row in self._visible_rows():
+            self.canvas.create_text(25, row.y + self.block_height / 2, text=base_pid,
+                                   font=('Arial', 10, 'bold'), tags='view')
+            if detailed:
+                self._draw_row_detail(row, first_time, last_time, clip_time)
             else:
-                self.canvas.create_rectangle(x1, y, x2, y + block_height, 
-                                           fill=color, outline='green', width=2)
-                text_color = 'black'
-                status_text = "OK"
-            
-            self.canvas.create_text((x1 + x2) / 2, y + block_height / 2 - 5, 
-                                   text=base_pid, font=('Arial', 9, 'bold'),
-                                   fill=text_color)
-            self.canvas.create_text((x1 + x2) / 2, y + block_height / 2 + 5, 
-                                   text=status_text, font=('Arial', 8),
-                                   fill=text_color)
+                self._draw_row_aggregated(row, first_time, last_time, clip_time)
         
-        for process_id, y in y_positions.items():
-            self.canvas.create_text(25, y + block_height / 2, text=process_id, 
-                                   font=('Arial', 10, 'bold'))
+        if self._cursor is not None:
+            self._move_cursor(self._clip_time)
+    
+    def item_counts(self) -> Dict[str, int]:
+        """Canvas items alive now: all of them, and those redrawn with the viewport."""
+        return {'canvas_items': len(self.canvas.find_all()),
+                'canvas_view_items': len(self.canvas.find_withtag('view'))}
+    
+    def _move_cursor(self, current_time: int):
+        x = self._time_to_x(current_time)
+        self.canvas.coords(self._cursor, x, self.start_y - 20, x, self._rows_bottom())
+        self.canvas.tag_raise(self._cursor)
+    
+    def _prepare(self, schedule):
+        self.stop_animation()
+        self.canvas.delete("all")
+        self._set_rows(self._index_rows(schedule))
+        self._max_time = self._schedule_max_time(schedule)
+        self._clip_time = None
+        self._cursor = None
+        self._running = []
+        self._draw_frame()
+        self._update_scrollregion()
+    
+    def draw_schedule(self, schedule: List[Tuple], current_time: int = None):
+        if not schedule:
+            self.stop_animation()
+            self.canvas.delete("all")
+            self._set_rows({})
+            return
         
+        self._prepare(schedule)
         if current_time is not None:
-            x = start_x + current_time * time_scale
-            self.canvas.create_line(x, start_y - 20, x, current_y, 
-                                   fill='red', width=3)
+            self._cursor = self.canvas.create_line(0, 0, 0, 0, fill='red', width=3,
+                                                   tags='frame')
             self.time_label.config(text=f"Ciclo: {current_time}")
-        
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.render_viewport()
+        if current_time is not None:
+            self._move_cursor(current_time)
     
     def animate_schedule(self, schedule: List[Tuple], delay: int = 1000):
         if not schedule:
             return
         
         self.clear()
-        max_time = max(end for _, _, end in schedule)
+        self._prepare(schedule)
+        max_time = self._max_time
+        self._cursor = self.canvas.create_line(0, 0, 0, 0, fill='red', width=3, tags='frame')
         
+        # At detailed zoom a tick only adds new segments and stretches running ones.
         def update_animation(current_time):
-            visible_schedule = []
-            for process_id, start_time, end_time in schedule:
-                if start_time < current_time:
-                    visible_end = min(end_time, current_time)
-                    visible_schedule.append((process_id, start_time, visible_end))
+            self._animation_job = None
+            previous_time = self._clip_time
+            self._clip_time = current_time
             
-            self.draw_schedule(visible_schedule, current_time)
+            if previous_time is None or self.time_scale < DETAIL_SCALE:
+                self.render_viewport()
+            else:
+                self._advance_detail(previous_time, current_time)
+                self._move_cursor(current_time)
+            self.time_label.config(text=f"Ciclo: {current_time}")
             
             if current_time <= max_time:
-                self.parent.after(delay, lambda: update_animation(current_time + 1))
+                self._animation_job = self.parent.after(
+                    delay, lambda: update_animation(current_time + 1))
+            else:
+                self._clip_time = None
         
         update_animation(0)
-
+    
+    def _advance_detail(self, previous_time: int, current_time: int):
+        still_running = []
+        for process_id, start_time, end_time, y, items in self._running:
+            items = self._resize_segment(items, process_id, start_time,
+                                         min(end_time, current_time), y)
+            if end_time > current_time:
+                still_running.append((process_id, start_time, end_time, y, items))
+        
+        first_time, last_time = self._visible_window()
+        for _, row in self._visible_rows():
+            for i in row.index.starting_in(previous_time, current_time):
+                start_time, end_time = row.starts[i], row.ends[i]
+                if end_time <= first_time or start_time >= last_time:
+                    continue
+                process_id = row.process_ids[i]
+                items = self._create_segment(process_id, start_time,
+                                             min(end_time, current_time), row.y)
+                if end_time > current_time:
+                    still_running.append((process_id, start_time, end_time, row.y, items))
+        self._running = still_running
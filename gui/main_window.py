@@ -1,12 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import importlib
 import sys
 import traceback
-from gui.scheduling_tab import SchedulingTab
-from gui.synchronization_tab import SynchronizationTab
+
+# Notebook tabs: title, attribute, module, class and the name used in errors.
+# Each tab is imported and built the first time it is selected.
+TABS = (
+    ("Calendarización de Procesos", 'scheduling_tab', 'gui.scheduling_tab',
+     'SchedulingTab', "calendarización"),
+    ("Sincronización", 'synchronization_tab', 'gui.synchronization_tab',
+     'SynchronizationTab', "sincronización"),
+)
 
 class MainWindow:
     def __init__(self):
+        self.scheduling_tab = None
+        self.synchronization_tab = None
+        self.tab_frames = []
         try:
             self.root = tk.Tk()
             self.root.title("Simulador de Sistemas Operativos")
@@ -66,19 +77,13 @@ class MainWindow:
             self.notebook = ttk.Notebook(self.root)
             self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
             
-            try:
-                scheduling_frame = ttk.Frame(self.notebook)
-                self.notebook.add(scheduling_frame, text="Calendarización de Procesos")
-                self.scheduling_tab = SchedulingTab(scheduling_frame)
-            except Exception as e:
-                messagebox.showerror("Error", f"Error al crear pestaña de calendarización: {str(e)}")
-            
-            try:
-                synchronization_frame = ttk.Frame(self.notebook)
-                self.notebook.add(synchronization_frame, text="Sincronización")
-                self.synchronization_tab = SynchronizationTab(synchronization_frame)
-            except Exception as e:
-                messagebox.showerror("Error", f"Error al crear pestaña de sincronización: {str(e)}")
+            self.notebook.bind('<<NotebookTabChanged>>', lambda event: self.build_selected_tab())
+            for title, *_ in TABS:
+                frame = ttk.Frame(self.notebook)
+                self.notebook.add(frame, text=title)
+                self.tab_frames.append(frame)
+            # The first tab is built once the window is up.
+            self.root.after_idle(self.build_selected_tab)
             
             self.status_bar = ttk.Label(self.root, text="Listo", relief=tk.SUNKEN)
             self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
@@ -87,6 +92,22 @@ class MainWindow:
             self.show_critical_error("Error al configurar la interfaz de usuario", e)
             raise
     
+    def build_selected_tab(self):
+        """Build the selected tab if it has not been built yet."""
+        selected = self.notebook.select()
+        if not selected:
+            return
+        index = self.notebook.index(selected)
+        _, attribute, module_name, class_name, name = TABS[index]
+        if getattr(self, attribute) is not None:
+            return
+        
+        try:
+            tab_class = getattr(importlib.import_module(module_name), class_name)
+            setattr(self, attribute, tab_class(self.tab_frames[index]))
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al crear pestaña de {name}: {str(e)}")
+    
     def run(self):
         try:
             self.root.mainloop()
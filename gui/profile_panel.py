@@ -0,0 +1,59 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Optional
+
+from utils.profiling import Profile
+
+class ProfilePanel:
+    """Collapsible table of the last run's profile, off until "Medir rendimiento" is checked."""
+    
+    def __init__(self, parent):
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(fill=tk.X, pady=(5, 0))
+        
+        header = ttk.Frame(self.frame)
+        header.pack(fill=tk.X)
+        self.enabled_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(header, text="Medir rendimiento",
+                        variable=self.enabled_var).pack(side=tk.LEFT)
+        self.toggle_button = ttk.Button(header, text="▸ Perfil", command=self.toggle)
+        self.toggle_button.pack(side=tk.LEFT, padx=(5, 0))
+        
+        self.body = ttk.Frame(self.frame)
+        columns = ("Medida", "Valor")
+        self.tree = ttk.Treeview(self.body, columns=columns, show="headings", height=6)
+        self.tree.heading("Medida", text="Medida")
+        self.tree.heading("Valor", text="Valor")
+        self.tree.column("Medida", width=280, anchor=tk.W)
+        self.tree.column("Valor", width=120, anchor=tk.E)
+        scrollbar = ttk.Scrollbar(self.body, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.expanded = False
+    
+    def toggle(self) -> None:
+        self.expanded = not self.expanded
+        if self.expanded:
+            self.body.pack(fill=tk.X, pady=(5, 0))
+            self.toggle_button.config(text="▾ Perfil")
+        else:
+            self.body.pack_forget()
+            self.toggle_button.config(text="▸ Perfil")
+    
+    def new_profile(self) -> Optional[Profile]:
+        """A fresh profile for the next run, or None when measuring is off."""
+        return Profile() if self.enabled_var.get() else None
+    
+    def show(self, profile: Optional[Profile]) -> None:
+        if profile is None:
+            return
+        self.clear()
+        for label, value in profile.rows():
+            self.tree.insert("", tk.END, values=(label, value))
+        if not self.expanded:
+            self.toggle()
+    
+    def clear(self) -> None:
+        for item in self.tree.get_children():
+            self.tree.delete(item)
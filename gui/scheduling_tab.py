@@ -2,21 +2,23 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import List
 
-from algorithms.scheduling.fifo import FIFO
-from algorithms.scheduling.sjf import SJF
-from algorithms.scheduling.srt import SRT
-from algorithms.scheduling.round_robin import RoundRobin
-from algorithms.scheduling.priority import Priority
 from models.process import Process
-from utils.file_loader import FileLoader, FileValidationError
+from utils.profiling import phase, profiling
 from gui.gantt_chart import GanttChart
+from gui.profile_panel import ProfilePanel
+from gui.task_runner import TaskRunner
+
+# Engine modules are imported by the methods that use them to keep startup fast.
+QUEUE_OPTIONS = {"Global": 'global', "Por núcleo": 'per-core'}
+MAX_CORES = 256
 
 class SchedulingTab:
     def __init__(self, parent):
         self.parent = parent
         self.processes: List[Process] = []
         self.current_schedule = []
-        self.animation_running = False
+        self.schedule_cache = None
+        self.workload_hash = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -53,6 +55,20 @@ class SchedulingTab:
         quantum_entry = ttk.Entry(algo_frame, textvariable=self.quantum_var, width=5)
         quantum_entry.pack(side=tk.LEFT, padx=(5, 10))
         
+        ttk.Label(algo_frame, text="Núcleos:").pack(side=tk.LEFT)
+        self.cores_var = tk.StringVar(value="1")
+        ttk.Entry(algo_frame, textvariable=self.cores_var, width=5).pack(
+            side=tk.LEFT, padx=(5, 10))
+        
+        ttk.Label(algo_frame, text="Colas:").pack(side=tk.LEFT)
+        self.queues_var = tk.StringVar(value="Global")
+        ttk.Combobox(algo_frame, textvariable=self.queues_var, values=list(QUEUE_OPTIONS),
+                     state="readonly", width=10).pack(side=tk.LEFT, padx=(5, 10))
+        
+        self.steal_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(algo_frame, text="Robo de trabajo",
+                        variable=self.steal_var).pack(side=tk.LEFT)
+        
         button_frame = ttk.Frame(control_frame)
         button_frame.pack(fill=tk.X)
         
@@ -65,6 +81,9 @@ class SchedulingTab:
         ttk.Button(button_frame, text="Limpiar", 
                   command=self.clear_all).pack(side=tk.LEFT, padx=(0, 5))
         
+        self.task_runner = TaskRunner(control_frame)
+        self.profile_panel = ProfilePanel(control_frame)
+        
         info_frame = ttk.LabelFrame(main_frame, text="Información de Procesos", padding=10)
         info_frame.pack(fill=tk.X, pady=(0, 10))
         
@@ -92,6 +111,15 @@ class SchedulingTab:
         self.avg_turnaround_label = ttk.Label(metrics_frame, text="Tiempo Promedio de Retorno: N/A")
         self.avg_turnaround_label.pack(anchor=tk.W)
         
+        self.avg_response_label = ttk.Label(metrics_frame, text="Tiempo Promedio de Respuesta: N/A")
+        self.avg_response_label.pack(anchor=tk.W)
+        
+        self.waiting_spread_label = ttk.Label(metrics_frame, text="Espera p50/p95/p99/Máx: N/A")
+        self.waiting_spread_label.pack(anchor=tk.W)
+        
+        self.cpu_label = ttk.Label(metrics_frame, text="Utilización de CPU: N/A")
+        self.cpu_label.pack(anchor=tk.W)
+        
         gantt_frame = ttk.LabelFrame(main_frame, text="Diagrama de Gantt", padding=10)
         gantt_frame.pack(fill=tk.BOTH, expand=True)
         
@@ -100,20 +128,30 @@ class SchedulingTab:
     def browse_file(self):
         file_path = filedialog.askopenfilename(
             title="Seleccionar Archivo de Procesos",
-            filetypes=[("Archivos de texto", "*.txt"), ("Todos los archivos", "*.*")]
+            filetypes=[("Archivos de texto", "*.txt"), ("Trazas binarias", "*.trace"),
+                       ("Todos los archivos", "*.*")]
         )
         if file_path:
             self.file_path_var.set(file_path)
     
     def load_processes(self):
+        from utils.file_loader import FileLoader, FileValidationError
+        from utils.schedule_cache import workload_hash
+        
         file_path = self.file_path_var.get()
         if not file_path:
             messagebox.showerror("Error", "Por favor seleccione un archivo primero")
             return
         
+        profile = self.profile_panel.new_profile()
         try:
-            self.processes = FileLoader.load_processes(file_path)
+            with profiling(profile):
+                with phase('load'):
+                    self.processes = FileLoader.load_processes(file_path)
+                with phase('hash'):
+                    self.workload_hash = workload_hash(self.processes)
             self.update_process_table()
+            self.profile_panel.show(profile)
             messagebox.showinfo("Éxito", f"Se cargaron {len(self.processes)} procesos")
         except FileValidationError as e:
             messagebox.showerror("Error de Validación", str(e))
@@ -150,80 +188,160 @@ class SchedulingTab:
                 raise ValueError("El quantum debe ser un entero válido")
             raise
     
+    def validate_cores(self):
+        try:
+            cores = int(self.cores_var.get())
+        except ValueError:
+            raise ValueError("La cantidad de núcleos debe ser un entero válido")
+        if cores <= 0:
+            raise ValueError("La cantidad de núcleos debe ser positiva")
+        if cores > MAX_CORES:
+            raise ValueError(f"Demasiados núcleos (máximo {MAX_CORES})")
+        return cores
+    
     def calculate_schedule(self):
         if not self.processes:
             messagebox.showerror("Error", "Por favor cargue procesos primero")
             return
         
+        from utils.metrics import schedule_metrics
+        from utils.runner import (SCHEDULERS, compute_schedule, fresh_processes,
+                                  normalize_name, normalize_queues, variant)
+        from utils.schedule_cache import ScheduleCache
+        
         algorithm = self.algorithm_var.get()
         
         try:
             if algorithm not in ["FIFO", "SJF", "SRT", "Round Robin", "Prioridad"]:
                 raise ValueError(f"Algoritmo inválido seleccionado: {algorithm}")
             
-            if algorithm == "Round Robin":
+            key = normalize_name(algorithm, SCHEDULERS)
+            quantum = None
+            if key == 'RR':
                 quantum = self.validate_quantum()
                 if len(self.processes) == 0:
                     raise ValueError("No hay procesos para calendarizar")
                 
                 if all(p.burst_time == 0 for p in self.processes):
                     raise ValueError("Todos los procesos tienen tiempo de ráfaga cero")
-                
-                self.current_schedule = RoundRobin.schedule(self.processes.copy(), quantum)
-            else:
-                if algorithm == "FIFO":
-                    self.current_schedule = FIFO.schedule(self.processes.copy())
-                elif algorithm == "SJF":
-                    self.current_schedule = SJF.schedule(self.processes.copy())
-                elif algorithm == "SRT":
-                    self.current_schedule = SRT.schedule(self.processes.copy())
-                elif algorithm == "Prioridad":
-                    self.current_schedule = Priority.schedule(self.processes.copy())
-            
-            if not self.current_schedule:
-                raise ValueError("El algoritmo produjo una calendarización vacía")
-            
-            self.update_process_table()
-            self.update_metrics()
-            self.gantt_chart.draw_schedule(self.current_schedule)
             
+            cores = self.validate_cores()
+            queues = normalize_queues(QUEUE_OPTIONS[self.queues_var.get()])
+            steal = self.steal_var.get()
+        
         except ValueError as e:
             messagebox.showerror("Error de Validación", str(e))
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al calcular calendarización: {str(e)}")
+            return
+        
+        # The worker schedules private copies, so the table and the chart
+        # keep showing the previous result until the new one is ready.
+        processes = fresh_processes(self.processes)
+        if self.schedule_cache is None:
+            self.schedule_cache = ScheduleCache()
+        cache = self.schedule_cache
+        content = self.workload_hash
+        profile = self.profile_panel.new_profile()
+        
+        def work(task):
+            with profiling(profile):
+                task.set_stage("Calendarizando")
+                with phase('schedule'):
+                    schedule = cache.schedule(
+                        processes, variant(key, cores, queues, steal), quantum,
+                        lambda runs: compute_schedule(runs, key, quantum, cores, queues, steal),
+                        content)
+                task.set_stage("Calculando métricas")
+                with phase('metrics'):
+                    metrics = schedule_metrics(processes, schedule)
+                if profile is not None:
+                    profile.count('context_switches', metrics['context_switches'] or 0)
+            return schedule, metrics
+        
+        def done(result):
+            schedule, metrics = result
+            if not schedule:
+                messagebox.showerror("Error de Validación",
+                                     "El algoritmo produjo una calendarización vacía")
+                return
+            self.processes = processes
+            self.current_schedule = schedule
+            self.update_process_table()
+            self.update_metrics(metrics)
+            with profiling(profile), phase('render'):
+                self.gantt_chart.draw_schedule(schedule)
+            if profile is not None:
+                for name, items in self.gantt_chart.item_counts().items():
+                    profile.peak(name, items)
+                self.profile_panel.show(profile)
+        
+        self.stop_animation()
+        self.task_runner.start(work, done, self.show_schedule_error)
     
-    def update_metrics(self):
-        if not self.processes:
+    def show_schedule_error(self, error):
+        if isinstance(error, ValueError):
+            messagebox.showerror("Error de Validación", str(error))
+        else:
+            messagebox.showerror("Error", f"Error al calcular calendarización: {str(error)}")
+    
+    def update_metrics(self, metrics=None):
+        if not self.processes or not self.current_schedule:
             return
         
-        waiting_times = [p.waiting_time for p in self.processes if p.waiting_time is not None]
-        turnaround_times = [p.turnaround_time for p in self.processes if p.turnaround_time is not None]
+        if metrics is None:
+            from utils.metrics import schedule_metrics
+            metrics = schedule_metrics(self.processes, self.current_schedule)
         
-        if waiting_times:
-            avg_waiting = sum(waiting_times) / len(waiting_times)
-            self.avg_waiting_label.config(text=f"Tiempo Promedio de Espera: {avg_waiting:.2f}")
+        if metrics['avg_waiting_time'] is not None:
+            self.avg_waiting_label.config(
+                text=f"Tiempo Promedio de Espera: {metrics['avg_waiting_time']:.2f} "
+                     f"(σ {metrics['std_waiting_time']:.2f})")
+            self.waiting_spread_label.config(
+                text=f"Espera p50/p95/p99/Máx: {metrics['p50_waiting_time']:.2f} / "
+                     f"{metrics['p95_waiting_time']:.2f} / {metrics['p99_waiting_time']:.2f} / "
+                     f"{metrics['max_waiting_time']:.0f}")
         
-        if turnaround_times:
-            avg_turnaround = sum(turnaround_times) / len(turnaround_times)
-            self.avg_turnaround_label.config(text=f"Tiempo Promedio de Retorno: {avg_turnaround:.2f}")
+        if metrics['avg_turnaround_time'] is not None:
+            self.avg_turnaround_label.config(
+                text=f"Tiempo Promedio de Retorno: {metrics['avg_turnaround_time']:.2f} "
+                     f"(p95 {metrics['p95_turnaround_time']:.2f})")
+        
+        if metrics['avg_response_time'] is not None:
+            self.avg_response_label.config(
+                text=f"Tiempo Promedio de Respuesta: {metrics['avg_response_time']:.2f} "
+                     f"(p95 {metrics['p95_response_time']:.2f})")
+        
+        if metrics['utilization'] is not None:
+            self.cpu_label.config(
+                text=f"Utilización de CPU: {metrics['utilization']:.1%} | "
+                     f"Rendimiento: {metrics['throughput']:.3f} procesos/ciclo | "
+                     f"Cambios de Contexto: {metrics['context_switches']}")
     
     def animate_schedule(self):
         if not self.current_schedule:
             messagebox.showerror("Error", "Por favor calcule la calendarización primero")
             return
         
-        self.animation_running = True
         self.gantt_chart.animate_schedule(self.current_schedule, delay=1000)
     
+    @property
+    def animation_running(self):
+        return self.gantt_chart.animating
+    
     def stop_animation(self):
-        self.animation_running = False
+        self.task_runner.cancel()
+        self.gantt_chart.stop_animation()
     
     def clear_all(self):
         self.processes.clear()
+        self.workload_hash = None
         self.current_schedule.clear()
-        self.animation_running = False
+        self.task_runner.cancel()
         self.update_process_table()
         self.gantt_chart.clear()
+        self.profile_panel.clear()
         self.avg_waiting_label.config(text="Tiempo Promedio de Espera: N/A")
         self.avg_turnaround_label.config(text="Tiempo Promedio de Retorno: N/A")
+        self.avg_response_label.config(text="Tiempo Promedio de Respuesta: N/A")
+        self.waiting_spread_label.config(text="Espera p50/p95/p99/Máx: N/A")
+        self.cpu_label.config(text="Utilización de CPU: N/A")
 
@@ -2,13 +2,20 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import List
 
-from algorithms.synchronization.mutex import Mutex
-from algorithms.synchronization.semaphore import Semaphore
 from models.process import Process
 from models.resource import Resource
 from models.action import Action, ActionState
-from utils.file_loader import FileLoader, FileValidationError
+from models.schedule import Schedule
+from utils.profiling import phase, profiling
 from gui.gantt_chart import GanttChart
+from gui.profile_panel import ProfilePanel
+from gui.task_runner import TaskRunner
+
+MECHANISMS = {
+    "Mutex": 'MUTEX',
+    "Mutex Lectores/Escritores": 'RWLOCK',
+    "Semáforo": 'SEMAPHORE',
+}
 
 class SynchronizationTab:
     def __init__(self, parent):
@@ -17,7 +24,6 @@ class SynchronizationTab:
         self.resources: List[Resource] = []
         self.actions: List[Action] = []
         self.current_simulation = []
-        self.animation_running = False
         self.setup_ui()
     
     def setup_ui(self):
@@ -66,9 +72,19 @@ class SynchronizationTab:
         ttk.Label(sync_frame, text="Mecanismo de Sincronización:").pack(side=tk.LEFT)
         self.sync_mechanism_var = tk.StringVar(value="Mutex")
         sync_combo = ttk.Combobox(sync_frame, textvariable=self.sync_mechanism_var,
-                                 values=["Mutex", "Semáforo"], state="readonly", width=15)
+                                 values=list(MECHANISMS),
+                                 state="readonly", width=25)
         sync_combo.pack(side=tk.LEFT, padx=(5, 10))
         
+        ttk.Label(sync_frame, text="Duración de acceso (vacío = ráfaga):").pack(side=tk.LEFT)
+        self.hold_time_var = tk.StringVar(value="")
+        ttk.Entry(sync_frame, textvariable=self.hold_time_var, width=5).pack(
+            side=tk.LEFT, padx=(5, 10))
+        
+        self.hold_and_wait_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(sync_frame, text="Semáforo: retener recursos y detectar interbloqueos",
+                       variable=self.hold_and_wait_var).pack(side=tk.LEFT)
+        
         button_frame = ttk.Frame(control_frame)
         button_frame.pack(fill=tk.X)
         
@@ -81,6 +97,9 @@ class SynchronizationTab:
         ttk.Button(button_frame, text="Limpiar", 
                   command=self.clear_all).pack(side=tk.LEFT, padx=(0, 5))
         
+        self.task_runner = TaskRunner(control_frame)
+        self.profile_panel = ProfilePanel(control_frame)
+        
         info_container = ttk.Frame(main_frame)
         info_container.pack(fill=tk.X, pady=(0, 10))
         
@@ -149,24 +168,32 @@ class SynchronizationTab:
     def browse_file(self, var):
         file_path = filedialog.askopenfilename(
             title="Seleccionar Archivo",
-            filetypes=[("Archivos de texto", "*.txt"), ("Todos los archivos", "*.*")]
+            filetypes=[("Archivos de texto", "*.txt"), ("Trazas binarias", "*.trace"),
+                       ("Todos los archivos", "*.*")]
         )
         if file_path:
             var.set(file_path)
     
     def load_all_files(self):
+        from utils.file_loader import FileLoader, FileValidationError
+        
+        profile = self.profile_panel.new_profile()
         try:
             if self.process_file_var.get():
-                self.processes = FileLoader.load_processes(self.process_file_var.get())
+                with profiling(profile), phase('load'):
+                    self.processes = FileLoader.load_processes(self.process_file_var.get())
                 self.update_process_table()
             
             if self.resource_file_var.get():
-                self.resources = FileLoader.load_resources(self.resource_file_var.get())
+                with profiling(profile), phase('load'):
+                    self.resources = FileLoader.load_resources(self.resource_file_var.get())
                 self.update_resource_table()
             
             if self.action_file_var.get():
-                self.actions = FileLoader.load_actions(self.action_file_var.get())
+                with profiling(profile), phase('load'):
+                    self.actions = FileLoader.load_actions(self.action_file_var.get())
                 self.update_action_table()
+            self.profile_panel.show(profile)
             
             messagebox.showinfo("Éxito", 
                               f"Se cargaron {len(self.processes)} procesos, "
@@ -211,59 +238,101 @@ class SynchronizationTab:
             values = (pid, action, start_time, end_time, state.value)
             self.result_tree.insert("", tk.END, values=values)
     
+    def validate_hold_time(self):
+        value = self.hold_time_var.get().strip()
+        if not value:
+            return None
+        try:
+            hold_time = int(value)
+        except ValueError:
+            raise ValueError("La duración de acceso debe ser un entero válido")
+        if hold_time <= 0:
+            raise ValueError("La duración de acceso debe ser positiva")
+        return hold_time
+    
     def simulate(self):
         if not self.processes or not self.resources or not self.actions:
             messagebox.showerror("Error", "Por favor cargue todos los archivos primero")
             return
         
-        mechanism = self.sync_mechanism_var.get()
+        # The engines load with the first simulation, not with the tab.
+        from utils.runner import run_synchronization
         
+        mechanism = MECHANISMS.get(self.sync_mechanism_var.get())
         try:
-            for resource in self.resources:
-                resource.available = resource.count
-                resource.waiting_processes.clear()
-            
-            if mechanism == "Mutex":
-                self.current_simulation = Mutex.simulate(
-                    self.processes.copy(), self.resources.copy(), self.actions.copy())
-            else:
-                self.current_simulation = Semaphore.simulate(
-                    self.processes.copy(), self.resources.copy(), self.actions.copy())
-            
-            self.update_result_table()
-            
-            timeline_data = []
-            for pid, action, start_time, end_time, state in self.current_simulation:
+            if mechanism is None:
+                raise ValueError(f"Mecanismo inválido: {self.sync_mechanism_var.get()}")
+            hold_time = self.validate_hold_time() if mechanism != 'SEMAPHORE' else None
+        except ValueError as e:
+            messagebox.showerror("Error", f"Error al simular: {str(e)}")
+            return
+        
+        processes, resources, actions = (list(self.processes), list(self.resources),
+                                         list(self.actions))
+        hold_and_wait = self.hold_and_wait_var.get()
+        profile = self.profile_panel.new_profile()
+        
+        def work(task):
+            task.set_stage("Simulando")
+            with profiling(profile):
+                result = run_synchronization(processes, resources, actions, mechanism,
+                                             hold_time, hold_and_wait)
+            task.set_stage("Preparando línea de tiempo")
+            timeline_data = Schedule()
+            for pid, action, start_time, end_time, state in result['results']:
                 timeline_data.append((f"{pid}_{action}", start_time, end_time))
+            return result, timeline_data
+        
+        def done(outcome):
+            result, timeline_data = outcome
+            self.current_simulation = result['results']
+            self.update_result_table()
+            with profiling(profile), phase('render'):
+                self.timeline_chart.draw_schedule(timeline_data)
+            if profile is not None:
+                for name, items in self.timeline_chart.item_counts().items():
+                    profile.peak(name, items)
+                self.profile_panel.show(profile)
             
-            self.timeline_chart.draw_schedule(timeline_data)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al simular: {str(e)}")
+            deadlock = result['deadlock']
+            if deadlock is not None:
+                messagebox.showwarning(
+                    "Interbloqueo detectado",
+                    f"Procesos bloqueados: {', '.join(deadlock.pids)}\n{deadlock.describe()}")
+        
+        def failed(error):
+            messagebox.showerror("Error", f"Error al simular: {str(error)}")
+        
+        self.stop_animation()
+        self.task_runner.start(work, done, failed)
     
     def animate_simulation(self):
         if not self.current_simulation:
             messagebox.showerror("Error", "Por favor ejecute la simulación primero")
             return
         
-        self.animation_running = True
-        
-        timeline_data = []
+        timeline_data = Schedule()
         for pid, action, start_time, end_time, state in self.current_simulation:
             color_suffix = "_EXITO" if state == ActionState.ACCESSED else "_ESPERA"
             timeline_data.append((f"{pid}_{action}{color_suffix}", start_time, end_time))
         
         self.timeline_chart.animate_schedule(timeline_data, delay=1000)
     
+    @property
+    def animation_running(self):
+        return self.timeline_chart.animating
+    
     def stop_animation(self):
-        self.animation_running = False
+        self.task_runner.cancel()
+        self.timeline_chart.stop_animation()
     
     def clear_all(self):
         self.processes.clear()
         self.resources.clear()
         self.actions.clear()
         self.current_simulation.clear()
-        self.animation_running = False
+        self.task_runner.cancel()
+        self.profile_panel.clear()
         
         self.update_process_table()
         self.update_resource_table()
@@ -0,0 +1,85 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+
+from utils.background import BackgroundTask, Cancelled
+
+POLL_INTERVAL = 50
+
+class TaskRunner:
+    """Runs one background computation at a time for a tab, polling it from the Tk thread.
+    
+    Starting a new computation cancels the previous one and drops its result.
+    """
+    
+    def __init__(self, parent):
+        self.parent = parent
+        self.task: Optional[BackgroundTask] = None
+        self._poll_job = None
+        self._on_done = None
+        self._on_error = None
+        
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(fill=tk.X, pady=(5, 0))
+        self.progress_var = tk.DoubleVar(value=0)
+        self.status_var = tk.StringVar(value="")
+        ttk.Progressbar(self.frame, variable=self.progress_var, maximum=100,
+                        length=200).pack(side=tk.LEFT)
+        ttk.Label(self.frame, textvariable=self.status_var).pack(side=tk.LEFT, padx=(5, 0))
+    
+    @property
+    def running(self) -> bool:
+        return self.task is not None
+    
+    def start(self, function: Callable[[BackgroundTask], object],
+              on_done: Callable[[object], None],
+              on_error: Optional[Callable[[BaseException], None]] = None) -> BackgroundTask:
+        self.cancel()
+        self._on_done = on_done
+        self._on_error = on_error
+        self.progress_var.set(0)
+        self.status_var.set("Iniciando...")
+        self.task = BackgroundTask(function).start()
+        self._poll_job = self.parent.after(POLL_INTERVAL, self._poll)
+        return self.task
+    
+    def cancel(self) -> None:
+        if self.task is None:
+            return
+        self.task.cancel()
+        self.task = None
+        if self._poll_job is not None:
+            self.parent.after_cancel(self._poll_job)
+            self._poll_job = None
+        self.progress_var.set(0)
+        self.status_var.set("Cancelado")
+    
+    def _poll(self) -> None:
+        self._poll_job = None
+        task = self.task
+        if task is None:
+            return
+        
+        if not task.finished.is_set():
+            self.progress_var.set(100 * task.fraction)
+            if task.total_steps:
+                self.status_var.set(f"{task.stage_name} {100 * task.fraction:.0f}%")
+            else:
+                self.status_var.set(f"{task.stage_name}...")
+            self._poll_job = self.parent.after(POLL_INTERVAL, self._poll)
+            return
+        
+        self.task = None
+        if task.error is None:
+            self.progress_var.set(100)
+            self.status_var.set("Listo")
+            self._on_done(task.result)
+        elif isinstance(task.error, Cancelled):
+            self.progress_var.set(0)
+            self.status_var.set("Cancelado")
+        else:
+            self.progress_var.set(0)
+            self.status_var.set("Error")
+            if self._on_error is None:
+                raise task.error
+            self._on_error(task.error)
@@ -1,21 +1,76 @@
 #!/usr/bin/env python3
+import time
+
+STARTED = time.perf_counter()
+
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from gui.main_window import MainWindow
+HEADLESS_COMMANDS = ('run', 'sweep', 'sync', 'bench', 'generate')
+
+# --startup-time[=MS] measures launch to first paint against this budget.
+STARTUP_FLAG = '--startup-time'
+STARTUP_BUDGET_MS = 500
+PROJECT_PACKAGES = ('gui', 'models', 'algorithms', 'utils')
+
+def startup_budget(argv):
+    """The --startup-time budget in ms, or None; ValueError unless a positive integer."""
+    for arg in argv:
+        if arg == STARTUP_FLAG:
+            return STARTUP_BUDGET_MS
+        if arg.startswith(STARTUP_FLAG + '='):
+            value = arg.split('=', 1)[1]
+            try:
+                budget = int(value)
+            except ValueError:
+                budget = 0
+            if budget <= 0:
+                raise ValueError(f"{STARTUP_FLAG} espera un presupuesto en milisegundos "
+                                 f"entero y positivo, se recibió '{value}'")
+            return budget
+    return None
+
+def report_startup(app, budget_ms):
+    """Report the time to first paint and the project modules loaded by then, then close."""
+    app.root.update_idletasks()
+    elapsed_ms = (time.perf_counter() - STARTED) * 1000
+    loaded = sorted(name for name in sys.modules
+                    if name.split('.')[0] in PROJECT_PACKAGES)
+    print(f"Primer dibujo: {elapsed_ms:.0f} ms (presupuesto {budget_ms} ms)", file=sys.stderr)
+    print(f"Módulos del proyecto cargados ({len(loaded)}): {', '.join(loaded)}",
+          file=sys.stderr)
+    app.root.destroy()
+    return elapsed_ms <= budget_ms
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in HEADLESS_COMMANDS:
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    
+    try:
+        budget = startup_budget(sys.argv[1:])
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    within_budget = []
+    from gui.main_window import MainWindow
+    
     try:
         app = MainWindow()
+        if budget is not None:
+            app.root.after_idle(lambda: within_budget.append(report_startup(app, budget)))
         app.run()
     except KeyboardInterrupt:
         print("\nApplication terminated by user")
     except Exception as e:
         print(f"An error occurred: {str(e)}")
         sys.exit(1)
+    
+    if within_budget and not within_budget[0]:
+        print("El arranque superó el presupuesto", file=sys.stderr)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
-
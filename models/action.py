@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from enum import Enum
 
 class ActionType(Enum):
@@ -9,11 +8,24 @@ class ActionState(Enum):
     ACCESSED = "ACCEDIDO"
     WAITING = "ESPERANDO"
 
-@dataclass
 class Action:
-    pid: str
-    action_type: ActionType
-    resource: str
-    cycle: int
-    state: ActionState = ActionState.WAITING
-
+    __slots__ = ('pid', 'action_type', 'resource', 'cycle', 'state')
+    
+    def __init__(self, pid: str, action_type: ActionType, resource: str, cycle: int,
+                 state: ActionState = ActionState.WAITING):
+        self.pid = pid
+        self.action_type = action_type
+        self.resource = resource
+        self.cycle = cycle
+        self.state = state
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Action({fields})"
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
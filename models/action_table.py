@@ -0,0 +1,65 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List
+from models.action import Action, ActionType
+
+ACTION_TYPES = list(ActionType)
+ACTION_TYPE_CODES = {action_type: code for code, action_type in enumerate(ACTION_TYPES)}
+
+class ActionTable:
+    """Struct-of-arrays store for actions with interned PID and resource names."""
+
+    __slots__ = ('pids', 'resources', '_pid_index', '_resource_index',
+                 'pid_column', 'type_column', 'resource_column', 'cycle_column')
+
+    def __init__(self):
+        self.pids: List[str] = []
+        self.resources: List[str] = []
+        self._pid_index: Dict[str, int] = {}
+        self._resource_index: Dict[str, int] = {}
+        self.pid_column = array('i')
+        self.type_column = array('b')
+        self.resource_column = array('i')
+        self.cycle_column = array('i')
+
+    @classmethod
+    def from_actions(cls, actions: Iterable[Action]) -> 'ActionTable':
+        table = cls()
+        for a in actions:
+            table.append(a.pid, a.action_type, a.resource, a.cycle)
+        return table
+
+    def intern_pid(self, pid: str) -> int:
+        index = self._pid_index.get(pid)
+        if index is None:
+            index = self._pid_index[pid] = len(self.pids)
+            self.pids.append(pid)
+        return index
+
+    def intern_resource(self, resource: str) -> int:
+        index = self._resource_index.get(resource)
+        if index is None:
+            index = self._resource_index[resource] = len(self.resources)
+            self.resources.append(resource)
+        return index
+
+    def append(self, pid: str, action_type: ActionType, resource: str, cycle: int) -> None:
+        self.pid_column.append(self.intern_pid(pid))
+        self.type_column.append(ACTION_TYPE_CODES[action_type])
+        self.resource_column.append(self.intern_resource(resource))
+        self.cycle_column.append(cycle)
+
+    def __len__(self) -> int:
+        return len(self.cycle_column)
+
+    def __getitem__(self, index: int) -> Action:
+        return Action(self.pids[self.pid_column[index]], ACTION_TYPES[self.type_column[index]],
+                      self.resources[self.resource_column[index]], self.cycle_column[index])
+
+    def __iter__(self) -> Iterator[Action]:
+        pids, resources = self.pids, self.resources
+        for pid_index, type_code, resource_index, cycle in zip(
+                self.pid_column, self.type_column, self.resource_column, self.cycle_column):
+            yield Action(pids[pid_index], ACTION_TYPES[type_code], resources[resource_index], cycle)
+
+    def to_actions(self) -> List[Action]:
+        return list(self)
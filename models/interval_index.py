@@ -0,0 +1,49 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+class IntervalIndex:
+    """Static index over [start, end) intervals; queries return the input positions.
+
+    For non-overlapping intervals, such as one CPU's segments, a query costs O(log n + k).
+    """
+
+    __slots__ = ('starts', 'ends', 'max_ends', 'order')
+
+    def __init__(self, starts: Iterable[int], ends: Iterable[int]):
+        starts = array('i', starts)
+        ends = array('i', ends)
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends must have the same length")
+
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        self.order = array('i', order)
+        self.starts = array('i', (starts[i] for i in order))
+        self.ends = array('i', (ends[i] for i in order))
+        self.max_ends = array('i')
+        running_max = 0
+        for end_time in self.ends:
+            if end_time > running_max:
+                running_max = end_time
+            self.max_ends.append(running_max)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def first_ending_after(self, time: float) -> int:
+        """Sorted position of the first interval that may still run after ``time``."""
+        return bisect_right(self.max_ends, time)
+
+    def overlapping(self, start: float, end: float) -> Iterator[int]:
+        """Positions of the intervals that overlap [start, end)."""
+        starts, ends, order = self.starts, self.ends, self.order
+        stop = bisect_left(starts, end)
+        for i in range(self.first_ending_after(start), stop):
+            if ends[i] > start:
+                yield order[i]
+
+    def starting_in(self, start: float, end: float) -> Iterator[int]:
+        """Positions of the intervals whose start falls in [start, end)."""
+        order = self.order
+        for i in range(bisect_left(self.starts, start), bisect_left(self.starts, end)):
+            yield order[i]
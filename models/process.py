@@ -1,24 +1,35 @@
-from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
 class Process:
-    pid: str
-    burst_time: int
-    arrival_time: int
-    priority: int
-    remaining_time: Optional[int] = None
-    start_time: Optional[int] = None
-    completion_time: Optional[int] = None
-    waiting_time: Optional[int] = None
-    turnaround_time: Optional[int] = None
+    __slots__ = ('pid', 'burst_time', 'arrival_time', 'priority', 'remaining_time',
+                 'start_time', 'completion_time', 'waiting_time', 'turnaround_time')
     
-    def __post_init__(self):
-        if self.remaining_time is None:
-            self.remaining_time = self.burst_time
+    def __init__(self, pid: str, burst_time: int, arrival_time: int, priority: int,
+                 remaining_time: Optional[int] = None, start_time: Optional[int] = None,
+                 completion_time: Optional[int] = None, waiting_time: Optional[int] = None,
+                 turnaround_time: Optional[int] = None):
+        self.pid = pid
+        self.burst_time = burst_time
+        self.arrival_time = arrival_time
+        self.priority = priority
+        self.remaining_time = burst_time if remaining_time is None else remaining_time
+        self.start_time = start_time
+        self.completion_time = completion_time
+        self.waiting_time = waiting_time
+        self.turnaround_time = turnaround_time
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Process({fields})"
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
     
     def calculate_metrics(self):
         if self.completion_time is not None and self.start_time is not None:
             self.turnaround_time = self.completion_time - self.arrival_time
             self.waiting_time = self.turnaround_time - self.burst_time
-
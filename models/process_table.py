@@ -0,0 +1,47 @@
+from array import array
+from typing import Iterable, Iterator, List
+from models.process import Process
+
+class ProcessTable:
+    """Struct-of-arrays store for process input columns, one row per process."""
+
+    __slots__ = ('pids', 'burst_times', 'arrival_times', 'priorities')
+
+    def __init__(self):
+        self.pids: List[str] = []
+        self.burst_times = array('i')
+        self.arrival_times = array('i')
+        self.priorities = array('i')
+
+    @classmethod
+    def from_processes(cls, processes: Iterable[Process]) -> 'ProcessTable':
+        table = cls()
+        for p in processes:
+            table.append(p.pid, p.burst_time, p.arrival_time, p.priority)
+        return table
+
+    def append(self, pid: str, burst_time: int, arrival_time: int, priority: int) -> None:
+        self.pids.append(pid)
+        self.burst_times.append(burst_time)
+        self.arrival_times.append(arrival_time)
+        self.priorities.append(priority)
+
+    def extend(self, other: 'ProcessTable') -> None:
+        self.pids.extend(other.pids)
+        self.burst_times.extend(other.burst_times)
+        self.arrival_times.extend(other.arrival_times)
+        self.priorities.extend(other.priorities)
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def __getitem__(self, index: int) -> Process:
+        return Process(self.pids[index], self.burst_times[index],
+                       self.arrival_times[index], self.priorities[index])
+
+    def __iter__(self) -> Iterator[Process]:
+        for row in zip(self.pids, self.burst_times, self.arrival_times, self.priorities):
+            yield Process(*row)
+
+    def to_processes(self) -> List[Process]:
+        return list(self)
@@ -1,31 +1,53 @@
-from dataclasses import dataclass
-from typing import List
+from collections import deque
+from typing import Iterable, Optional
 
-@dataclass
 class Resource:
-    name: str
-    count: int
-    available: int = None
-    waiting_processes: List[str] = None
+    __slots__ = ('name', 'count', 'available', 'waiting_processes', '_waiting')
+    _fields = ('name', 'count', 'available', 'waiting_processes')
     
-    def __post_init__(self):
-        if self.available is None:
-            self.available = self.count
-        if self.waiting_processes is None:
-            self.waiting_processes = []
+    def __init__(self, name: str, count: int, available: Optional[int] = None,
+                 waiting_processes: Optional[Iterable[str]] = None):
+        self.name = name
+        self.count = count
+        self.available = count if available is None else available
+        # FIFO wait queue plus a set for O(1) membership checks
+        self.waiting_processes = deque(() if waiting_processes is None else waiting_processes)
+        self._waiting = set(self.waiting_processes)
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"Resource({fields})"
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+    
+    __hash__ = None
     
     def acquire(self, process_id: str) -> bool:
         if self.available > 0:
             self.available -= 1
             return True
         else:
-            if process_id not in self.waiting_processes:
+            if process_id not in self._waiting:
+                self._waiting.add(process_id)
                 self.waiting_processes.append(process_id)
             return False
     
     def release(self, process_id: str) -> str:
         self.available += 1
         if self.waiting_processes:
-            return self.waiting_processes.pop(0)
+            next_process = self.waiting_processes.popleft()
+            self._waiting.discard(next_process)
+            return next_process
+        return None
+    
+    def transfer(self, process_id: str) -> Optional[str]:
+        """Release one unit, handing it straight to the next waiter if there is one."""
+        if self.waiting_processes:
+            next_process = self.waiting_processes.popleft()
+            self._waiting.discard(next_process)
+            return next_process
+        self.available += 1
         return None
-
@@ -0,0 +1,174 @@
+from array import array
+from itertools import islice, repeat
+from operator import sub
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from models.interval_index import IntervalIndex
+
+Segment = Tuple[str, int, int]
+TaggedSegment = Tuple[str, int, int, int]
+
+class Schedule:
+    """Columnar (pid, start, end) segments with an interned PID table; iterates as plain tuples."""
+
+    __slots__ = ('pids', '_pid_index', 'pid_column', 'start_column', 'end_column', '_intervals')
+
+    cores = 1
+
+    def __init__(self, segments: Iterable[Segment] = ()):
+        self.pids: List[str] = []
+        self._pid_index: Dict[str, int] = {}
+        self.pid_column = array('i')
+        self.start_column = array('i')
+        self.end_column = array('i')
+        self._intervals: Optional[IntervalIndex] = None
+        for segment in segments:
+            self.append(segment)
+
+    def intern(self, pid: str) -> int:
+        index = self._pid_index.get(pid)
+        if index is None:
+            index = len(self.pids)
+            self._pid_index[pid] = index
+            self.pids.append(pid)
+        return index
+
+    def append(self, segment: Segment) -> None:
+        pid, start_time, end_time = segment
+        self.pid_column.append(self.intern(pid))
+        self.start_column.append(start_time)
+        self.end_column.append(end_time)
+        self._intervals = None
+
+    def extend(self, segments: Iterable[Segment]) -> None:
+        for segment in segments:
+            self.append(segment)
+
+    def clear(self) -> None:
+        self.pids.clear()
+        self._pid_index.clear()
+        del self.pid_column[:]
+        del self.start_column[:]
+        del self.end_column[:]
+        self._intervals = None
+
+    def __len__(self) -> int:
+        return len(self.pid_column)
+
+    def __iter__(self) -> Iterator[Segment]:
+        pids = self.pids
+        for pid_index, start_time, end_time in zip(self.pid_column, self.start_column,
+                                                   self.end_column):
+            yield (pids[pid_index], start_time, end_time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(islice(self, *index.indices(len(self))))
+        return (self.pids[self.pid_column[index]], self.start_column[index],
+                self.end_column[index])
+
+    def __setitem__(self, index: int, segment: Segment) -> None:
+        pid, start_time, end_time = segment
+        self.pid_column[index] = self.intern(pid)
+        self.start_column[index] = start_time
+        self.end_column[index] = end_time
+        self._intervals = None
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Schedule, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Schedule({len(self)} segments, {len(self.pids)} pids)"
+
+    def copy(self) -> 'Schedule':
+        copied = self.__class__.__new__(self.__class__)
+        copied._intervals = None
+        copied.pids = self.pids.copy()
+        copied._pid_index = self._pid_index.copy()
+        copied.pid_column = array('i', self.pid_column)
+        copied.start_column = array('i', self.start_column)
+        copied.end_column = array('i', self.end_column)
+        return copied
+
+    def makespan(self) -> int:
+        return max(self.end_column) if self.end_column else 0
+
+    def busy_time(self) -> int:
+        return sum(map(sub, self.end_column, self.start_column))
+
+    def context_switches(self) -> int:
+        column = self.pid_column
+        return sum(1 for a, b in zip(column, islice(column, 1, None)) if a != b)
+
+    def first_start_times(self) -> array:
+        """Earliest start per interned PID, aligned with ``pids``."""
+        first = array('i', [-1]) * len(self.pids)
+        for pid_index, start_time in zip(self.pid_column, self.start_column):
+            if first[pid_index] < 0:
+                first[pid_index] = start_time
+        return first
+
+    def completion_times(self) -> array:
+        """Latest end per interned PID, aligned with ``pids``."""
+        last = array('i', [0]) * len(self.pids)
+        for pid_index, end_time in zip(self.pid_column, self.end_column):
+            if end_time > last[pid_index]:
+                last[pid_index] = end_time
+        return last
+
+    def positions(self, pids: Iterable[str]) -> array:
+        """Interned index of each PID in ``pids``, or -1 for PIDs that never ran."""
+        return array('q', map(self._pid_index.get, pids, repeat(-1)))
+
+    def interval_index(self) -> IntervalIndex:
+        """Interval index over the segments, built on first use and cached until a change."""
+        if self._intervals is None:
+            self._intervals = IntervalIndex(self.start_column, self.end_column)
+        return self._intervals
+
+    def overlapping(self, start_time: int, end_time: int) -> List[Segment]:
+        return [self[i] for i in self.interval_index().overlapping(start_time, end_time)]
+
+
+class CoreSchedule(Schedule):
+    """Schedule that also records the core of each segment; ``tagged`` yields it last."""
+
+    __slots__ = ('cores', 'core_column')
+
+    def __init__(self, cores: int = 1, segments: Iterable[Segment] = ()):
+        self.cores = cores
+        self.core_column = array('i')
+        super().__init__(segments)
+
+    def append(self, segment: Segment, core: int = 0) -> None:
+        super().append(segment)
+        self.core_column.append(core)
+
+    def clear(self) -> None:
+        super().clear()
+        del self.core_column[:]
+
+    def copy(self) -> 'CoreSchedule':
+        copied = super().copy()
+        copied.cores = self.cores
+        copied.core_column = array('i', self.core_column)
+        return copied
+
+    def tagged(self) -> Iterator[TaggedSegment]:
+        pids = self.pids
+        for pid_index, start_time, end_time, core in zip(self.pid_column, self.start_column,
+                                                         self.end_column, self.core_column):
+            yield (pids[pid_index], start_time, end_time, core)
+
+    def context_switches(self) -> int:
+        """PID changes between consecutive segments of the same core."""
+        last = [-1] * self.cores
+        switches = 0
+        for core, pid_index in zip(self.core_column, self.pid_column):
+            previous = last[core]
+            if previous != pid_index:
+                if previous >= 0:
+                    switches += 1
+                last[core] = pid_index
+        return switches
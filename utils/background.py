@@ -0,0 +1,116 @@
+import threading
+from typing import Callable, Optional
+
+# Inner-loop iterations between two cancellation checks.
+CANCEL_CHECK_INTERVAL = 1024
+
+class Cancelled(BaseException):
+    pass
+
+class CancelToken:
+    """Set once to ask a running task to stop at its next progress report."""
+
+    __slots__ = ('_event',)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise Cancelled()
+
+_current = threading.local()
+
+def progress_reporter(total: int) -> Optional[Callable[[int], None]]:
+    """Reporter for a loop of ``total`` steps, or None outside a background task."""
+    task = getattr(_current, 'task', None)
+    if task is None:
+        return None
+    return task.stage(total)
+
+def cancel_checker(interval: int = CANCEL_CHECK_INTERVAL) -> Optional[Callable[[], None]]:
+    """Throttled cancellation check for an engine loop, or None outside a background task.
+
+    Progress is only reported on completions, so engines also call this once per event.
+    """
+    task = getattr(_current, 'task', None)
+    if task is None:
+        return None
+    return task.checker(interval)
+
+class BackgroundTask:
+    """Runs ``function(task)`` in a daemon thread; the GUI polls its progress, result and error."""
+
+    def __init__(self, function: Callable[['BackgroundTask'], object]):
+        self.function = function
+        self.token = CancelToken()
+        self.stage_name = ""
+        self.done_steps = 0
+        self.total_steps = 0
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> 'BackgroundTask':
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self.token.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    @property
+    def fraction(self) -> float:
+        return self.done_steps / self.total_steps if self.total_steps else 0.0
+
+    def set_stage(self, name: str) -> None:
+        self.token.raise_if_cancelled()
+        self.stage_name = name
+        self.done_steps = 0
+        self.total_steps = 0
+
+    def stage(self, total: int) -> Callable[[int], None]:
+        self.done_steps = 0
+        self.total_steps = total
+        token = self.token
+
+        def report(done: int) -> None:
+            self.done_steps = done
+            token.raise_if_cancelled()
+        return report
+
+    def checker(self, interval: int) -> Callable[[], None]:
+        token = self.token
+        calls = 0
+
+        def check() -> None:
+            nonlocal calls
+            calls += 1
+            if calls >= interval:
+                calls = 0
+                token.raise_if_cancelled()
+        return check
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.finished.wait(timeout)
+
+    def _run(self) -> None:
+        _current.task = self
+        try:
+            self.result = self.function(self)
+        except BaseException as e:
+            self.error = e
+        finally:
+            _current.task = None
+            self.finished.set()
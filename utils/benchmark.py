@@ -0,0 +1,176 @@
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from algorithms.scheduling.fifo import FIFO
+from algorithms.scheduling.sjf import SJF
+from algorithms.scheduling.srt import SRT
+from algorithms.scheduling.round_robin import RoundRobin
+from algorithms.scheduling.priority import Priority
+from algorithms.scheduling.smp import SMP
+from algorithms.synchronization.mutex import Mutex
+from algorithms.synchronization.semaphore import Semaphore
+from models.action import Action
+from models.process_table import ProcessTable
+from utils.generator import generate_resources, iter_action_rows, iter_process_rows
+
+SIZES = (1000, 10000, 100000, 1000000)
+BENCH_FIELDS = ['benchmark', 'size', 'arrival', 'burst', 'seconds', 'throughput',
+                'peak_memory', 'baseline_seconds', 'ratio', 'status']
+
+SYNC_PROCESSES = 100
+SYNC_RESOURCES = 8
+SMP_CORES = 64
+
+Workload = Tuple[ProcessTable, List[Action]]
+Benchmark = Callable[[Workload, int], Callable[[], object]]
+
+def _scheduler(algorithm) -> Benchmark:
+    def prepare(workload: Workload, quantum: int) -> Callable[[], object]:
+        processes = workload[0].to_processes()
+        return lambda: algorithm.schedule(processes, compact=True)
+    return prepare
+
+def _round_robin(workload: Workload, quantum: int) -> Callable[[], object]:
+    processes = workload[0].to_processes()
+    return lambda: RoundRobin.schedule(processes, quantum, compact=True)
+
+def _smp(workload: Workload, quantum: int) -> Callable[[], object]:
+    processes = workload[0].to_processes()
+    return lambda: SMP.schedule(processes, 'SRT', SMP_CORES, quantum)
+
+def _synchronizer(simulate: Callable) -> Benchmark:
+    def prepare(workload: Workload, quantum: int) -> Callable[[], object]:
+        table, actions = workload
+        processes = table.to_processes()
+        resources = generate_resources(SYNC_RESOURCES)
+        fresh = [Action(a.pid, a.action_type, a.resource, a.cycle) for a in actions]
+        return lambda: simulate(processes, resources, fresh)
+    return prepare
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    'FIFO': _scheduler(FIFO),
+    'SJF': _scheduler(SJF),
+    'SRT': _scheduler(SRT),
+    'RR': _round_robin,
+    'PRIORITY': _scheduler(Priority),
+    'SMP': _smp,
+    'MUTEX': _synchronizer(Mutex.simulate),
+    'SEMAPHORE': _synchronizer(Semaphore.simulate),
+}
+
+SYNC_BENCHMARKS = ('MUTEX', 'SEMAPHORE')
+
+def build_workload(benchmark: str, size: int, arrival: str, burst: str,
+                   seed: Optional[int]) -> Workload:
+    """Processes to schedule, or a fixed process set plus ``size`` actions to synchronize."""
+    if benchmark in SYNC_BENCHMARKS:
+        table = ProcessTable()
+        for row in iter_process_rows(SYNC_PROCESSES, arrival=arrival, burst=burst, seed=seed):
+            table.append(*row)
+        actions = [Action(*row) for row in iter_action_rows(
+            size, SYNC_PROCESSES, SYNC_RESOURCES, arrival=arrival, seed=seed)]
+        return table, actions
+
+    table = ProcessTable()
+    for row in iter_process_rows(size, arrival=arrival, burst=burst, seed=seed):
+        table.append(*row)
+    return table, []
+
+def measure(prepare: Callable[[], Callable[[], object]], repeat: int,
+            memory: bool) -> Tuple[float, Optional[int]]:
+    """Best wall time over ``repeat`` runs, then peak traced memory of one untimed run."""
+    best = None
+    for _ in range(repeat):
+        run = prepare()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del run
+
+    peak = None
+    if memory:
+        run = prepare()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+def run_benchmarks(names: Sequence[str] = tuple(BENCHMARKS), sizes: Sequence[int] = SIZES,
+                   arrival: str = 'poisson', burst: str = 'exponential',
+                   seed: Optional[int] = 0, quantum: int = 2, repeat: int = 3,
+                   memory: bool = True, budget: Optional[float] = 60.0,
+                   progress: Optional[Callable[[Dict[str, object]], None]] = None
+                   ) -> List[Dict[str, object]]:
+    """Time each benchmark at each size; sizes past ``budget`` seconds are skipped."""
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark {unknown[0]!r}, expected one of {sorted(BENCHMARKS)}")
+    if repeat <= 0:
+        raise ValueError(f"Repeat must be positive, got {repeat}")
+    if quantum <= 0:
+        raise ValueError("Quantum must be positive")
+
+    records = []
+    for name in names:
+        over_budget = False
+        for size in sorted(sizes):
+            record = {'benchmark': name, 'size': size, 'arrival': arrival, 'burst': burst,
+                      'seconds': None, 'throughput': None, 'peak_memory': None,
+                      'status': 'ok'}
+            if over_budget:
+                record['status'] = 'skipped'
+            else:
+                workload = build_workload(name, size, arrival, burst, seed)
+                seconds, peak = measure(lambda: BENCHMARKS[name](workload, quantum),
+                                        repeat, memory)
+                del workload
+                record.update(seconds=seconds, throughput=size / seconds if seconds else None,
+                              peak_memory=peak)
+                over_budget = budget is not None and seconds > budget
+            records.append(record)
+            if progress:
+                progress(record)
+    return records
+
+def _key(record: Dict[str, object]) -> Tuple:
+    return (record['benchmark'], record['size'], record['arrival'], record['burst'])
+
+def save_baseline(records: List[Dict[str, object]], path: str) -> None:
+    data = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': [{field: record[field] for field in BENCH_FIELDS[:7]}
+                    for record in records if record['status'] == 'ok'],
+    }
+    with open(path, 'w', encoding='utf-8') as stream:
+        json.dump(data, stream, indent=2)
+
+def load_baseline(path: str) -> Dict[Tuple, Dict[str, object]]:
+    with open(path, 'r', encoding='utf-8') as stream:
+        data = json.load(stream)
+    return {_key(record): record for record in data['results']}
+
+def compare(records: List[Dict[str, object]], baseline: Dict[Tuple, Dict[str, object]],
+            tolerance: float = 0.25) -> List[Dict[str, object]]:
+    """Annotate ``records`` with baseline times and return those over ``tolerance`` slower."""
+    regressions = []
+    for record in records:
+        reference = baseline.get(_key(record))
+        if reference is None or record['seconds'] is None or not reference['seconds']:
+            continue
+        record['baseline_seconds'] = reference['seconds']
+        record['ratio'] = record['seconds'] / reference['seconds']
+        if record['ratio'] > 1 + tolerance:
+            record['status'] = 'regression'
+            regressions.append(record)
+    return regressions
@@ -1,10 +1,20 @@
-from typing import List
+from typing import Iterator, List, Tuple, Union
 from models.process import Process
+from models.process_table import ProcessTable
 from models.resource import Resource
 from models.action import Action, ActionType
+from models.action_table import ActionTable
+from utils.trace_file import TraceFile, TraceFormatError, is_trace_file
 import os
 import re
 
+NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+ACTION_TYPE_BY_VALUE = {action_type.value: action_type for action_type in ActionType}
+DEFAULT_BATCH_SIZE = 65536
+
+ProcessRow = Tuple[str, int, int, int]
+ActionRow = Tuple[str, ActionType, str, int]
+
 class FileValidationError(Exception):
     pass
 
@@ -24,108 +34,114 @@ class FileLoader:
             raise FileValidationError(f"El archivo no se puede leer: {file_path}")
     
     @staticmethod
-    def validate_process_line(line: str, line_number: int) -> List[str]:
+    def parse_process_line(line: str, line_number: int) -> ProcessRow:
         if not line.strip():
             raise FileValidationError(f"Línea {line_number}: Línea vacía")
         
-        parts = [part.strip() for part in line.split(',')]
+        parts = line.split(',')
         
         if len(parts) < 4:
             raise FileValidationError(
                 f"Línea {line_number}: Se esperan 4 campos (PID, BT, AT, Prioridad), se encontraron {len(parts)}"
             )
         
-        pid = parts[0]
+        pid = parts[0].strip()
         if not pid:
             raise FileValidationError(f"Línea {line_number}: El PID no puede estar vacío")
         
-        if not re.match(r'^[A-Za-z0-9_-]+$', pid):
+        if not NAME_PATTERN.match(pid):
             raise FileValidationError(
                 f"Línea {line_number}: El PID '{pid}' contiene caracteres inválidos"
             )
         
         try:
             burst_time = int(parts[1])
-            if burst_time <= 0:
-                raise FileValidationError(
-                    f"Línea {line_number}: El tiempo de ráfaga debe ser positivo, se obtuvo {burst_time}"
-                )
         except ValueError:
             raise FileValidationError(
-                f"Línea {line_number}: El tiempo de ráfaga debe ser un entero, se obtuvo '{parts[1]}'"
+                f"Línea {line_number}: El tiempo de ráfaga debe ser un entero, se obtuvo '{parts[1].strip()}'"
+            )
+        if burst_time <= 0:
+            raise FileValidationError(
+                f"Línea {line_number}: El tiempo de ráfaga debe ser positivo, se obtuvo {burst_time}"
             )
         
         try:
             arrival_time = int(parts[2])
-            if arrival_time < 0:
-                raise FileValidationError(
-                    f"Línea {line_number}: El tiempo de llegada no puede ser negativo, se obtuvo {arrival_time}"
-                )
         except ValueError:
             raise FileValidationError(
-                f"Línea {line_number}: El tiempo de llegada debe ser un entero, se obtuvo '{parts[2]}'"
+                f"Línea {line_number}: El tiempo de llegada debe ser un entero, se obtuvo '{parts[2].strip()}'"
+            )
+        if arrival_time < 0:
+            raise FileValidationError(
+                f"Línea {line_number}: El tiempo de llegada no puede ser negativo, se obtuvo {arrival_time}"
             )
         
         try:
             priority = int(parts[3])
-            if priority < 0:
-                raise FileValidationError(
-                    f"Línea {line_number}: La prioridad no puede ser negativa, se obtuvo {priority}"
-                )
         except ValueError:
             raise FileValidationError(
-                f"Línea {line_number}: La prioridad debe ser un entero, se obtuvo '{parts[3]}'"
+                f"Línea {line_number}: La prioridad debe ser un entero, se obtuvo '{parts[3].strip()}'"
+            )
+        if priority < 0:
+            raise FileValidationError(
+                f"Línea {line_number}: La prioridad no puede ser negativa, se obtuvo {priority}"
             )
         
-        return parts
+        return pid, burst_time, arrival_time, priority
     
     @staticmethod
-    def load_processes(file_path: str) -> List[Process]:
+    def validate_process_line(line: str, line_number: int) -> List[str]:
+        FileLoader.parse_process_line(line, line_number)
+        return [part.strip() for part in line.split(',')]
+    
+    @staticmethod
+    def iter_process_rows(file_path: str) -> Iterator[ProcessRow]:
+        """Yield validated (pid, burst, arrival, priority) rows one line at a time."""
         try:
             FileLoader.validate_file_exists(file_path)
             
-            processes = []
+            if is_trace_file(file_path):
+                with TraceFile(file_path) as trace:
+                    if not len(trace):
+                        raise FileValidationError("No se encontraron procesos válidos en el archivo")
+                    yield from trace.process_rows()
+                return
+            
             seen_pids = set()
-            line_number = 0
+            parse = FileLoader.parse_process_line
             
             with open(file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line_number += 1
+                for line_number, line in enumerate(file, 1):
                     line = line.strip()
                     
-                    if not line or line.startswith('#'):
+                    if not line or line[0] == '#':
                         continue
                     
                     try:
-                        parts = FileLoader.validate_process_line(line, line_number)
-                        
-                        pid = parts[0]
-                        burst_time = int(parts[1])
-                        arrival_time = int(parts[2])
-                        priority = int(parts[3])
-                        
-                        if pid in seen_pids:
-                            raise FileValidationError(
-                                f"Línea {line_number}: PID duplicado '{pid}'"
-                            )
-                        seen_pids.add(pid)
-                        
-                        processes.append(Process(pid, burst_time, arrival_time, priority))
-                        
+                        row = parse(line, line_number)
                     except FileValidationError:
                         raise
                     except Exception as e:
                         raise FileValidationError(
                             f"Línea {line_number}: Error inesperado - {str(e)}"
                         )
+                    
+                    pid = row[0]
+                    if pid in seen_pids:
+                        raise FileValidationError(
+                            f"Línea {line_number}: PID duplicado '{pid}'"
+                        )
+                    seen_pids.add(pid)
+                    
+                    yield row
             
-            if not processes:
+            if not seen_pids:
                 raise FileValidationError("No se encontraron procesos válidos en el archivo")
             
-            return processes
-            
         except FileValidationError:
             raise
+        except TraceFormatError as e:
+            raise FileValidationError(str(e))
         except UnicodeDecodeError:
             raise FileValidationError(f"Error de codificación del archivo: {file_path}")
         except PermissionError:
@@ -133,6 +149,40 @@ class FileLoader:
         except Exception as e:
             raise FileValidationError(f"Error inesperado cargando procesos: {str(e)}")
     
+    @staticmethod
+    def iter_processes(file_path: str) -> Iterator[Process]:
+        for row in FileLoader.iter_process_rows(file_path):
+            yield Process(*row)
+    
+    @staticmethod
+    def iter_process_batches(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                             columnar: bool = False) -> Iterator[Union[List[Process], ProcessTable]]:
+        if batch_size <= 0:
+            raise ValueError(f"Batch size must be positive, got {batch_size}")
+        
+        batch = ProcessTable() if columnar else []
+        for row in FileLoader.iter_process_rows(file_path):
+            if columnar:
+                batch.append(*row)
+            else:
+                batch.append(Process(*row))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = ProcessTable() if columnar else []
+        if batch:
+            yield batch
+    
+    @staticmethod
+    def load_processes(file_path: str) -> List[Process]:
+        return list(FileLoader.iter_processes(file_path))
+    
+    @staticmethod
+    def load_process_table(file_path: str) -> ProcessTable:
+        table = ProcessTable()
+        for row in FileLoader.iter_process_rows(file_path):
+            table.append(*row)
+        return table
+    
     @staticmethod
     def load_resources(file_path: str) -> List[Resource]:
         try:
@@ -161,7 +211,7 @@ class FileLoader:
                     if not name:
                         raise FileValidationError(f"Línea {line_number}: El nombre del recurso no puede estar vacío")
                     
-                    if not re.match(r'^[A-Za-z0-9_-]+$', name):
+                    if not NAME_PATTERN.match(name):
                         raise FileValidationError(
                             f"Línea {line_number}: El nombre del recurso '{name}' contiene caracteres inválidos"
                         )
@@ -196,65 +246,108 @@ class FileLoader:
             raise FileValidationError(f"Error inesperado cargando recursos: {str(e)}")
     
     @staticmethod
-    def load_actions(file_path: str) -> List[Action]:
+    def parse_action_line(line: str, line_number: int) -> ActionRow:
+        parts = line.split(',')
+        
+        if len(parts) < 4:
+            raise FileValidationError(
+                f"Línea {line_number}: Se esperan 4 campos (PID, Acción, Recurso, Ciclo), se encontraron {len(parts)}"
+            )
+        
+        pid = parts[0].strip()
+        if not pid:
+            raise FileValidationError(f"Línea {line_number}: El PID no puede estar vacío")
+        
+        action_type = ACTION_TYPE_BY_VALUE.get(parts[1].strip().upper())
+        if action_type is None:
+            valid_actions = [action.value for action in ActionType]
+            raise FileValidationError(
+                f"Línea {line_number}: Acción inválida '{parts[1].strip()}'. Acciones válidas: {valid_actions}"
+            )
+        
+        resource = parts[2].strip()
+        if not resource:
+            raise FileValidationError(f"Línea {line_number}: El recurso no puede estar vacío")
+        
+        try:
+            cycle = int(parts[3])
+        except ValueError:
+            raise FileValidationError(
+                f"Línea {line_number}: El ciclo debe ser un entero, se obtuvo '{parts[3].strip()}'"
+            )
+        if cycle < 0:
+            raise FileValidationError(
+                f"Línea {line_number}: El ciclo no puede ser negativo, se obtuvo {cycle}"
+            )
+        
+        return pid, action_type, resource, cycle
+    
+    @staticmethod
+    def iter_action_rows(file_path: str) -> Iterator[ActionRow]:
+        """Yield validated (pid, action_type, resource, cycle) rows one line at a time."""
         try:
             FileLoader.validate_file_exists(file_path)
             
-            actions = []
-            line_number = 0
+            if is_trace_file(file_path):
+                with TraceFile(file_path) as trace:
+                    if not len(trace):
+                        raise FileValidationError("No se encontraron acciones válidas en el archivo")
+                    yield from trace.action_rows()
+                return
+            
+            found = False
+            parse = FileLoader.parse_action_line
             
             with open(file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line_number += 1
+                for line_number, line in enumerate(file, 1):
                     line = line.strip()
                     
-                    if not line or line.startswith('#'):
+                    if not line or line[0] == '#':
                         continue
                     
-                    parts = [part.strip() for part in line.split(',')]
-                    
-                    if len(parts) < 4:
-                        raise FileValidationError(
-                            f"Línea {line_number}: Se esperan 4 campos (PID, Acción, Recurso, Ciclo), se encontraron {len(parts)}"
-                        )
-                    
-                    pid = parts[0]
-                    if not pid:
-                        raise FileValidationError(f"Línea {line_number}: El PID no puede estar vacío")
-                    
-                    action_str = parts[1].upper()
-                    try:
-                        action_type = ActionType(action_str)
-                    except ValueError:
-                        valid_actions = [action.value for action in ActionType]
-                        raise FileValidationError(
-                            f"Línea {line_number}: Acción inválida '{parts[1]}'. Acciones válidas: {valid_actions}"
-                        )
-                    
-                    resource = parts[2]
-                    if not resource:
-                        raise FileValidationError(f"Línea {line_number}: El recurso no puede estar vacío")
-                    
-                    try:
-                        cycle = int(parts[3])
-                        if cycle < 0:
-                            raise FileValidationError(
-                                f"Línea {line_number}: El ciclo no puede ser negativo, se obtuvo {cycle}"
-                            )
-                    except ValueError:
-                        raise FileValidationError(
-                            f"Línea {line_number}: El ciclo debe ser un entero, se obtuvo '{parts[3]}'"
-                        )
-                    
-                    actions.append(Action(pid, action_type, resource, cycle))
+                    found = True
+                    yield parse(line, line_number)
             
-            if not actions:
+            if not found:
                 raise FileValidationError("No se encontraron acciones válidas en el archivo")
             
-            return actions
-            
         except FileValidationError:
             raise
+        except TraceFormatError as e:
+            raise FileValidationError(str(e))
         except Exception as e:
             raise FileValidationError(f"Error inesperado cargando acciones: {str(e)}")
-
+    
+    @staticmethod
+    def iter_actions(file_path: str) -> Iterator[Action]:
+        for row in FileLoader.iter_action_rows(file_path):
+            yield Action(*row)
+    
+    @staticmethod
+    def iter_action_batches(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                            columnar: bool = False) -> Iterator[Union[List[Action], ActionTable]]:
+        if batch_size <= 0:
+            raise ValueError(f"Batch size must be positive, got {batch_size}")
+        
+        batch = ActionTable() if columnar else []
+        for row in FileLoader.iter_action_rows(file_path):
+            if columnar:
+                batch.append(*row)
+            else:
+                batch.append(Action(*row))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = ActionTable() if columnar else []
+        if batch:
+            yield batch
+    
+    @staticmethod
+    def load_actions(file_path: str) -> List[Action]:
+        return list(FileLoader.iter_actions(file_path))
+    
+    @staticmethod
+    def load_action_table(file_path: str) -> ActionTable:
+        table = ActionTable()
+        for row in FileLoader.iter_action_rows(file_path):
+            table.append(*row)
+        return table
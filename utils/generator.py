@@ -0,0 +1,159 @@
+import random
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from models.action import ActionType
+from models.action_table import ACTION_TYPES, ACTION_TYPE_CODES
+from models.resource import Resource
+from utils.file_loader import ActionRow, ProcessRow
+from utils.trace_file import EXTENSION, KIND_ACTIONS, KIND_PROCESSES, write_trace
+
+ARRIVALS = ('poisson', 'uniform', 'batch')
+BURSTS = ('exponential', 'uniform', 'pareto')
+
+PARETO_SHAPE = 1.5
+BATCH_SIZE = 8
+WRITE_BATCH_SIZE = 65536
+
+# Records use the binary trace layout:
+#   processes -> pid index, burst time, arrival time, priority
+#   actions   -> pid index, action type code, resource index, cycle
+Record = Tuple[int, int, int, int]
+
+def _arrival_times(rng: random.Random, arrival: str, mean_gap: float) -> Iterator[int]:
+    """Non-decreasing arrival times with ``mean_gap`` cycles between arrivals on average."""
+    if arrival not in ARRIVALS:
+        raise ValueError(f"Unknown arrival distribution '{arrival}', expected one of {ARRIVALS}")
+
+    clock = 0.0
+    index = 0
+    while True:
+        yield int(clock)
+        index += 1
+        if arrival == 'poisson':
+            clock += rng.expovariate(1 / mean_gap)
+        elif arrival == 'uniform':
+            clock += rng.uniform(0, 2 * mean_gap)
+        elif index % BATCH_SIZE == 0:
+            # Bursts of BATCH_SIZE simultaneous arrivals keep the same mean gap.
+            clock += rng.expovariate(1 / (BATCH_SIZE * mean_gap))
+
+def _burst_time(rng: random.Random, burst: str, mean_burst: float) -> int:
+    if burst == 'exponential':
+        return max(1, round(rng.expovariate(1 / mean_burst)))
+    if burst == 'uniform':
+        return rng.randint(1, max(1, round(2 * mean_burst) - 1))
+    if burst == 'pareto':
+        scale = mean_burst * (PARETO_SHAPE - 1) / PARETO_SHAPE
+        return max(1, round(scale * rng.paretovariate(PARETO_SHAPE)))
+    raise ValueError(f"Unknown burst distribution '{burst}', expected one of {BURSTS}")
+
+def _check_count(count: int) -> None:
+    if count < 0:
+        raise ValueError(f"Count must not be negative, got {count}")
+
+def iter_process_records(count: int, arrival: str = 'poisson', burst: str = 'exponential',
+                         mean_burst: float = 5, load: float = 0.9, priorities: int = 5,
+                         priority_weights: Optional[Sequence[float]] = None,
+                         seed: Optional[int] = 0) -> Iterator[Record]:
+    """Yield ``count`` reproducible process records at an offered CPU load of about ``load``."""
+    _check_count(count)
+    if mean_burst <= 0 or load <= 0:
+        raise ValueError("Mean burst and load must be positive")
+    if burst not in BURSTS:
+        raise ValueError(f"Unknown burst distribution '{burst}', expected one of {BURSTS}")
+    if priority_weights is not None:
+        if not priority_weights or any(weight < 0 for weight in priority_weights):
+            raise ValueError("Priority weights must be non-negative and not empty")
+        priorities = len(priority_weights)
+    elif priorities <= 0:
+        raise ValueError(f"Priorities must be positive, got {priorities}")
+
+    rng = random.Random(seed)
+    arrivals = _arrival_times(rng, arrival, mean_burst / load)
+    levels = range(1, priorities + 1)
+    cum_weights = list(accumulate(priority_weights)) if priority_weights is not None else None
+    for index in range(count):
+        if cum_weights is None:
+            priority = rng.randint(1, priorities)
+        else:
+            priority = rng.choices(levels, cum_weights=cum_weights)[0]
+        yield (index, _burst_time(rng, burst, mean_burst), next(arrivals), priority)
+
+def iter_action_records(count: int, processes: int, resources: int,
+                        arrival: str = 'poisson', mean_gap: float = 1,
+                        write_ratio: float = 0.3, hotspot: float = 0.0,
+                        hot_resources: int = 1, seed: Optional[int] = 0) -> Iterator[Record]:
+    """Yield ``count`` action records; a ``hotspot`` share goes to the first ``hot_resources``."""
+    _check_count(count)
+    if processes <= 0 or resources <= 0:
+        raise ValueError("Processes and resources must be positive")
+    if not 0 <= hotspot <= 1 or not 0 <= write_ratio <= 1:
+        raise ValueError("Hotspot and write ratio must be between 0 and 1")
+    if not 0 < hot_resources <= resources:
+        raise ValueError(f"Hot resources must be between 1 and {resources}")
+
+    rng = random.Random(seed)
+    cycles = _arrival_times(rng, arrival, mean_gap)
+    read, write = ACTION_TYPE_CODES[ActionType.READ], ACTION_TYPE_CODES[ActionType.WRITE]
+    for _ in range(count):
+        action_type = write if rng.random() < write_ratio else read
+        pool = hot_resources if hotspot and rng.random() < hotspot else resources
+        yield (rng.randrange(processes), action_type, rng.randrange(pool), next(cycles))
+
+def iter_process_rows(count: int, **distribution) -> Iterator[ProcessRow]:
+    """(pid, burst, arrival, priority) rows, as FileLoader yields them."""
+    for index, burst_time, arrival_time, priority in iter_process_records(count, **distribution):
+        yield (f"P{index + 1}", burst_time, arrival_time, priority)
+
+def iter_action_rows(count: int, processes: int, resources: int,
+                     **distribution) -> Iterator[ActionRow]:
+    """(pid, type, resource, cycle) rows, as FileLoader yields them."""
+    for pid_index, type_code, resource_index, cycle in iter_action_records(
+            count, processes, resources, **distribution):
+        yield (f"P{pid_index + 1}", ACTION_TYPES[type_code], f"R{resource_index + 1}", cycle)
+
+def generate_resources(count: int, max_units: int = 2) -> List[Resource]:
+    _check_count(count)
+    if max_units <= 0:
+        raise ValueError(f"Max units must be positive, got {max_units}")
+    return [Resource(f"R{index + 1}", 1 + index % max_units) for index in range(count)]
+
+def _names(prefix: str, count: int) -> Iterator[str]:
+    return (f"{prefix}{index + 1}" for index in range(count))
+
+def _write_lines(file_path: str, lines: Iterable[str]) -> int:
+    written = 0
+    lines = iter(lines)
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for batch in iter(lambda: list(islice(lines, WRITE_BATCH_SIZE)), []):
+            file.writelines(batch)
+            written += len(batch)
+    return written
+
+def _is_binary(file_path: str, binary: Optional[bool]) -> bool:
+    return file_path.endswith(EXTENSION) if binary is None else binary
+
+def write_processes(file_path: str, count: int, binary: Optional[bool] = None,
+                    **distribution) -> int:
+    """Stream ``count`` generated processes to ``file_path``, as a trace if binary or .trace."""
+    records = iter_process_records(count, **distribution)
+    if _is_binary(file_path, binary):
+        return write_trace(file_path, KIND_PROCESSES, _names('P', count), (), records)
+    return _write_lines(file_path, (f"P{index + 1}, {burst_time}, {arrival_time}, {priority}\n"
+                                    for index, burst_time, arrival_time, priority in records))
+
+def write_actions(file_path: str, count: int, processes: int, resources: int,
+                  binary: Optional[bool] = None, **distribution) -> int:
+    """Stream ``count`` generated actions to ``file_path`` and return the count."""
+    records = iter_action_records(count, processes, resources, **distribution)
+    if _is_binary(file_path, binary):
+        return write_trace(file_path, KIND_ACTIONS, _names('P', processes),
+                           _names('R', resources), records)
+    names = [action_type.value for action_type in ACTION_TYPES]
+    return _write_lines(file_path, (f"P{pid_index + 1}, {names[type_code]}, "
+                                    f"R{resource_index + 1}, {cycle}\n"
+                                    for pid_index, type_code, resource_index, cycle in records))
+
+def write_resources(file_path: str, count: int, max_units: int = 2) -> int:
+    return _write_lines(file_path, (f"{resource.name}, {resource.count}\n"
+                                    for resource in generate_resources(count, max_units)))
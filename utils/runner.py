@@ -0,0 +1,150 @@
+from typing import Dict, List, Optional
+from algorithms.scheduling.fifo import FIFO
+from algorithms.scheduling.sjf import SJF
+from algorithms.scheduling.srt import SRT
+from algorithms.scheduling.round_robin import RoundRobin
+from algorithms.scheduling.priority import Priority
+from algorithms.scheduling.smp import GLOBAL_QUEUE, QUEUE_MODES, SMP
+from algorithms.synchronization.mutex import Mutex
+from algorithms.synchronization.semaphore import Semaphore
+from models.process import Process
+from models.resource import Resource
+from models.action import Action, ActionState
+from models.schedule import Schedule
+from utils.metrics import schedule_metrics
+from utils.profiling import active_profile, phase
+from utils.schedule_cache import ScheduleCache
+
+SCHEDULERS = {
+    'FIFO': FIFO,
+    'SJF': SJF,
+    'SRT': SRT,
+    'RR': RoundRobin,
+    'PRIORITY': Priority,
+}
+
+SYNCHRONIZERS = {
+    'MUTEX': Mutex,
+    'RWLOCK': Mutex,
+    'SEMAPHORE': Semaphore,
+}
+
+ALIASES = {
+    'ROUND_ROBIN': 'RR',
+    'ROUNDROBIN': 'RR',
+    'PRIORIDAD': 'PRIORITY',
+    'SEMAFORO': 'SEMAPHORE',
+    'SEMÁFORO': 'SEMAPHORE',
+    'RW_MUTEX': 'RWLOCK',
+    'READ_WRITE': 'RWLOCK',
+}
+
+QUEUE_ALIASES = {
+    'percore': 'per-core',
+    'por-nucleo': 'per-core',
+    'por-núcleo': 'per-core',
+}
+
+def normalize_name(name: str, registry: Dict[str, object]) -> str:
+    key = name.strip().upper().replace('-', '_').replace(' ', '_')
+    key = ALIASES.get(key, key)
+    if key not in registry:
+        raise ValueError(f"Unknown algorithm '{name}', expected one of {sorted(registry)}")
+    return key
+
+def normalize_queues(queues: str) -> str:
+    mode = queues.strip().lower().replace('_', '-').replace(' ', '-')
+    mode = QUEUE_ALIASES.get(mode, mode)
+    if mode not in QUEUE_MODES:
+        raise ValueError(f"Unknown queue mode '{queues}', expected one of {QUEUE_MODES}")
+    return mode
+
+def fresh_processes(processes: List[Process]) -> List[Process]:
+    return [Process(p.pid, p.burst_time, p.arrival_time, p.priority) for p in processes]
+
+def fresh_resources(resources: List[Resource]) -> List[Resource]:
+    return [Resource(r.name, r.count) for r in resources]
+
+def fresh_actions(actions: List[Action]) -> List[Action]:
+    return [Action(a.pid, a.action_type, a.resource, a.cycle) for a in actions]
+
+def variant(key: str, cores: int = 1, queues: str = GLOBAL_QUEUE, steal: bool = False) -> str:
+    """Name of an algorithm run on ``cores`` CPUs, as used in cache keys."""
+    if cores == 1:
+        return key
+    return f"{key}@{cores}/{queues}" + ('+steal' if steal else '')
+
+def compute_schedule(processes: List[Process], key: str, quantum: Optional[int] = None,
+                     cores: int = 1, queues: str = GLOBAL_QUEUE,
+                     steal: bool = False) -> Schedule:
+    """Run the scheduler registered under ``key`` in place; SMP when ``cores`` > 1."""
+    if cores != 1:
+        return SMP.schedule(processes, key, cores, quantum, queues, steal)
+    if key == 'RR':
+        return RoundRobin.schedule(processes, quantum, compact=True)
+    return SCHEDULERS[key].schedule(processes, compact=True)
+
+def run_schedule(processes: List[Process], algorithm: str, quantum: Optional[int] = None,
+                 cache: Optional[ScheduleCache] = None, workload: Optional[str] = None,
+                 cores: int = 1, queues: str = GLOBAL_QUEUE,
+                 steal: bool = False) -> Dict[str, object]:
+    """Run one scheduler on a private copy of ``processes`` and summarize it."""
+    key = normalize_name(algorithm, SCHEDULERS)
+    runs = fresh_processes(processes)
+    quantum = (2 if quantum is None else quantum) if key == 'RR' else None
+    queues = normalize_queues(queues)
+    if cores <= 0:
+        raise ValueError(f"Core count must be positive, got {cores}")
+
+    def compute(ps: List[Process]) -> Schedule:
+        return compute_schedule(ps, key, quantum, cores, queues, steal)
+
+    with phase('schedule'):
+        if cache is None:
+            schedule = compute(runs)
+        else:
+            schedule = cache.schedule(runs, variant(key, cores, queues, steal), quantum,
+                                      compute, workload)
+    with phase('metrics'):
+        metrics = schedule_metrics(runs, schedule)
+    profile = active_profile()
+    if profile is not None:
+        profile.count('context_switches', metrics['context_switches'] or 0)
+
+    return {
+        'algorithm': key,
+        'quantum': quantum,
+        'cores': cores,
+        'queues': queues,
+        'steal': steal,
+        **metrics,
+        'schedule': schedule,
+        'processes': runs,
+    }
+
+def run_synchronization(processes: List[Process], resources: List[Resource],
+                        actions: List[Action], mechanism: str,
+                        hold_time: Optional[int] = None,
+                        hold_and_wait: bool = False) -> Dict[str, object]:
+    key = normalize_name(mechanism, SYNCHRONIZERS)
+    inputs = (fresh_processes(processes), fresh_resources(resources), fresh_actions(actions))
+    deadlock = None
+    with phase('simulate'):
+        if key == 'SEMAPHORE' and hold_and_wait:
+            results, deadlock = Semaphore.simulate_hold_and_wait(*inputs)
+        elif key == 'SEMAPHORE':
+            results = Semaphore.simulate(*inputs)
+        else:
+            mode = Mutex.READ_WRITE if key == 'RWLOCK' else Mutex.EXCLUSIVE
+            results = Mutex.simulate(*inputs, hold_time=hold_time, mode=mode)
+    accessed = sum(1 for result in results if result[4] == ActionState.ACCESSED)
+
+    return {
+        'mechanism': key,
+        'events': len(results),
+        'accessed': accessed,
+        'waiting': len(results) - accessed,
+        'makespan': max((result[3] for result in results), default=0),
+        'deadlock': deadlock,
+        'results': results,
+    }
@@ -0,0 +1,234 @@
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Callable, List, Optional, Union
+from models.process import Process
+from models.process_table import ProcessTable
+from models.schedule import CoreSchedule, Schedule
+from utils.profiling import active_profile
+
+CACHE_VERSION = 2
+CACHE_EXTENSION = '.sched'
+MISSING = -1
+
+# Entry layout (little-endian): header, '\0'-joined UTF-8 pids, then the
+# segment columns (pid index, start, end and, for multi-core, core) as int32
+# and the per-process start, completion and remaining times as int64.
+# ``cores`` is 0 for a plain Schedule.
+CACHE_MAGIC = b'SSCH'
+CACHE_HEADER = struct.Struct('<4sHHIIII')
+
+def workload_hash(processes: Union[ProcessTable, List[Process]]) -> str:
+    """SHA-256 of the process columns; equal workloads hash equal whatever file they came from."""
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(
+        processes)
+    digest = hashlib.sha256()
+    digest.update(len(table).to_bytes(8, 'little'))
+    digest.update('\0'.join(table.pids).encode('utf-8'))
+    for column in (table.burst_times, table.arrival_times, table.priorities):
+        if sys.byteorder == 'big':
+            column = array(column.typecode, column)
+            column.byteswap()
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+def cache_key(workload: str, algorithm: str, quantum: Optional[int]) -> str:
+    text = f"{CACHE_VERSION}:{workload}:{algorithm}:{quantum}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class CachedSchedule:
+    """A schedule plus the per-process fields the scheduler set, in input order."""
+    
+    __slots__ = ('schedule', 'start_times', 'completion_times', 'remaining_times')
+    
+    def __init__(self, schedule: Schedule, start_times: array, completion_times: array,
+                 remaining_times: array):
+        self.schedule = schedule
+        self.start_times = start_times
+        self.completion_times = completion_times
+        self.remaining_times = remaining_times
+    
+    @classmethod
+    def capture(cls, processes: List[Process], schedule: Schedule) -> 'CachedSchedule':
+        return cls(schedule.copy(),
+                   array('q', (MISSING if p.start_time is None else p.start_time
+                               for p in processes)),
+                   array('q', (MISSING if p.completion_time is None else p.completion_time
+                               for p in processes)),
+                   array('q', (p.remaining_time for p in processes)))
+    
+    def to_bytes(self) -> bytes:
+        schedule = self.schedule
+        columns = [schedule.pid_column, schedule.start_column, schedule.end_column]
+        if isinstance(schedule, CoreSchedule):
+            columns.append(schedule.core_column)
+        columns += [self.start_times, self.completion_times, self.remaining_times]
+        names = '\0'.join(schedule.pids).encode('utf-8')
+        cores = schedule.cores if isinstance(schedule, CoreSchedule) else 0
+        chunks = [CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, cores, len(schedule.pids),
+                                    len(names), len(schedule), len(self.start_times)), names]
+        for column in columns:
+            if sys.byteorder == 'big':
+                column = array(column.typecode, column)
+                column.byteswap()
+            chunks.append(column.tobytes())
+        return b''.join(chunks)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CachedSchedule':
+        """Decode ``to_bytes`` output; raises ValueError on anything malformed."""
+        if len(data) < CACHE_HEADER.size:
+            raise ValueError("Truncated cache entry")
+        (magic, version, cores, pid_count, names_size, segment_count,
+         process_count) = CACHE_HEADER.unpack_from(data)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            raise ValueError("Not a schedule cache entry")
+        
+        offset = CACHE_HEADER.size
+        pids = data[offset:offset + names_size].decode('utf-8').split('\0') if pid_count else []
+        if len(pids) != pid_count:
+            raise ValueError("Corrupt pid table")
+        offset += names_size
+        
+        def column(typecode: str, count: int) -> array:
+            nonlocal offset
+            values = array(typecode)
+            size = values.itemsize * count
+            values.frombytes(data[offset:offset + size])
+            if len(values) != count:
+                raise ValueError("Truncated cache entry")
+            if sys.byteorder == 'big':
+                values.byteswap()
+            offset += size
+            return values
+        
+        schedule = CoreSchedule(cores) if cores else Schedule()
+        for pid in pids:
+            schedule.intern(pid)
+        schedule.pid_column = column('i', segment_count)
+        schedule.start_column = column('i', segment_count)
+        schedule.end_column = column('i', segment_count)
+        if cores:
+            schedule.core_column = column('i', segment_count)
+        entry = cls(schedule, column('q', process_count), column('q', process_count),
+                    column('q', process_count))
+        if offset != len(data) or len(schedule.pids) != pid_count:
+            raise ValueError("Corrupt cache entry")
+        if segment_count and not (0 <= min(schedule.pid_column)
+                                  and max(schedule.pid_column) < pid_count):
+            raise ValueError("PID index out of range in cache entry")
+        if cores and segment_count and not (0 <= min(schedule.core_column)
+                                            and max(schedule.core_column) < cores):
+            raise ValueError("Core index out of range in cache entry")
+        return entry
+    
+    def restore(self, processes: List[Process]) -> Schedule:
+        """Put the cached fields back on ``processes`` and return a fresh copy of the schedule."""
+        for p, start_time, completion_time, remaining_time in zip(
+                processes, self.start_times, self.completion_times, self.remaining_times):
+            p.start_time = None if start_time == MISSING else start_time
+            p.completion_time = None if completion_time == MISSING else completion_time
+            p.remaining_time = remaining_time
+            p.waiting_time = None
+            p.turnaround_time = None
+            p.calculate_metrics()
+        return self.schedule.copy()
+
+class ScheduleCache:
+    """Thread-safe LRU of schedules, mirrored to ``directory`` when set."""
+    
+    def __init__(self, maxsize: int = 64, directory: Optional[str] = None):
+        if maxsize <= 0:
+            raise ValueError(f"Cache size must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.directory = directory
+        self.entries: 'OrderedDict[str, CachedSchedule]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_EXTENSION)
+    
+    def get(self, key: str) -> Optional[CachedSchedule]:
+        with self._lock:
+            return self._get(key)
+    
+    def _get(self, key: str) -> Optional[CachedSchedule]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as file:
+                    data = file.read()
+            except OSError:
+                return None
+            try:
+                entry = CachedSchedule.from_bytes(data)
+            except Exception:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+                return None
+            self._remember(key, entry)
+        return entry
+    
+    def put(self, key: str, entry: CachedSchedule) -> None:
+        with self._lock:
+            self._put(key, entry)
+    
+    def _put(self, key: str, entry: CachedSchedule) -> None:
+        self._remember(key, entry)
+        if self.directory:
+            handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(handle, 'wb') as file:
+                    file.write(entry.to_bytes())
+                os.replace(temp_path, self._path(key))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+    
+    def _remember(self, key: str, entry: CachedSchedule) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+    
+    def schedule(self, processes: List[Process], algorithm: str, quantum: Optional[int],
+                 compute: Callable[[List[Process]], Schedule],
+                 workload: Optional[str] = None) -> Schedule:
+        """Return the schedule of ``processes``, running ``compute`` only on a miss."""
+        key = cache_key(workload or workload_hash(processes), algorithm, quantum)
+        entry = self.get(key)
+        profile = active_profile()
+        if entry is not None:
+            self.hits += 1
+            if profile is not None:
+                profile.count('cache_hits')
+            return entry.restore(processes)
+        
+        self.misses += 1
+        if profile is not None:
+            profile.count('cache_misses')
+        schedule = compute(processes)
+        self.put(key, CachedSchedule.capture(processes, schedule))
+        return schedule
@@ -0,0 +1,104 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from models.process import Process
+from models.process_table import ProcessTable
+from utils.metrics import SCHEDULE_METRICS
+from utils.runner import (GLOBAL_QUEUE, SCHEDULERS, normalize_name, normalize_queues,
+                          run_schedule)
+from utils.schedule_cache import ScheduleCache, workload_hash
+
+SWEEP_FIELDS = ['workload', 'algorithm', 'quantum', 'cores'] + SCHEDULE_METRICS
+
+Task = Tuple[str, str, Optional[int], int]
+
+# Per-worker copy of the workloads, installed once by the pool initializer so
+# tasks only carry (workload, algorithm, quantum, cores).
+_worker_workloads: Dict[str, ProcessTable] = {}
+_worker_cache: Optional[ScheduleCache] = None
+_worker_queues = GLOBAL_QUEUE
+_worker_steal = False
+
+def _available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks where the OS has them."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def _install_workloads(workloads: Dict[str, ProcessTable], cache_dir: Optional[str] = None,
+                       queues: str = GLOBAL_QUEUE, steal: bool = False) -> None:
+    global _worker_workloads, _worker_cache, _worker_queues, _worker_steal
+    _worker_workloads = workloads
+    _worker_cache = ScheduleCache(directory=cache_dir) if cache_dir else None
+    _worker_queues = queues
+    _worker_steal = steal
+
+def _run(task: Task, workloads: Dict[str, ProcessTable], cache: Optional[ScheduleCache],
+         queues: str, steal: bool) -> Dict[str, object]:
+    workload, algorithm, quantum, cores = task
+    result = run_schedule(workloads[workload].to_processes(), algorithm, quantum, cache,
+                          cores=cores, queues=queues, steal=steal)
+    row = {'workload': workload}
+    row.update((field, result[field]) for field in SWEEP_FIELDS[1:])
+    return row
+
+def _run_task(task: Task) -> Dict[str, object]:
+    return _run(task, _worker_workloads, _worker_cache, _worker_queues, _worker_steal)
+
+def build_tasks(workloads: Iterable[str], algorithms: Sequence[str],
+                quanta: Sequence[int], cores: Sequence[int] = (1,)) -> List[Task]:
+    keys = [normalize_name(algorithm, SCHEDULERS) for algorithm in algorithms]
+    tasks = []
+    for workload in workloads:
+        for key in keys:
+            for quantum in (quanta if key == 'RR' else [None]):
+                for core_count in cores:
+                    tasks.append((workload, key, quantum, core_count))
+    return tasks
+
+def sweep(workloads: Dict[str, Union[ProcessTable, List[Process]]],
+          algorithms: Sequence[str] = tuple(SCHEDULERS), quanta: Sequence[int] = (2,),
+          max_workers: Optional[int] = None, cache_dir: Optional[str] = None,
+          cores: Sequence[int] = (1,), queues: str = GLOBAL_QUEUE,
+          steal: bool = False) -> List[Dict[str, object]]:
+    """Run every (workload, algorithm, quantum, cores) combination once per distinct content.
+
+    Returns one metrics row per combination in task order; ``max_workers=1`` runs in-process.
+    """
+    if any(quantum <= 0 for quantum in quanta):
+        raise ValueError("Quantum must be positive")
+    if any(core_count <= 0 for core_count in cores):
+        raise ValueError("Core count must be positive")
+    queues = normalize_queues(queues)
+
+    tables = {name: workload if isinstance(workload, ProcessTable)
+              else ProcessTable.from_processes(workload)
+              for name, workload in workloads.items()}
+    tasks = build_tasks(tables, algorithms, quanta, cores)
+    if not tasks:
+        return []
+
+    hashes = {name: workload_hash(table) for name, table in tables.items()}
+    unique: Dict[Tuple[str, str, Optional[int], int], Task] = {}
+    for workload, key, quantum, core_count in tasks:
+        unique.setdefault((hashes[workload], key, quantum, core_count),
+                          (workload, key, quantum, core_count))
+    distinct = list(unique.values())
+
+    workers = min(max_workers or _available_cpus(), len(distinct))
+    if workers == 1:
+        cache = ScheduleCache(directory=cache_dir) if cache_dir else None
+        rows = [_run(task, tables, cache, queues, steal) for task in distinct]
+    else:
+        chunksize = max(1, len(distinct) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_install_workloads,
+                                 initargs=(tables, cache_dir, queues, steal)) as executor:
+            rows = list(executor.map(_run_task, distinct, chunksize=chunksize))
+
+    by_content = dict(zip(unique, rows))
+    results = []
+    for workload, key, quantum, core_count in tasks:
+        row = dict(by_content[(hashes[workload], key, quantum, core_count)])
+        row['workload'] = workload
+        results.append(row)
+    return results
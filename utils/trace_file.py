@@ -0,0 +1,289 @@
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain, islice
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+from models.process import Process
+from models.process_table import ProcessTable
+from models.action import Action
+from models.action_table import ActionTable, ACTION_TYPES
+
+# Layout (little-endian):
+#   header   magic, version, kind, record count, pid count, resource count, records offset
+#   strings  pid table then resource table, each entry a uint16 length + UTF-8 bytes
+#   padding  up to a 4-byte boundary
+#   records  four int32 fields per record:
+#            processes -> pid index, burst time, arrival time, priority
+#            actions   -> pid index, action type code, resource index, cycle
+MAGIC = b'SSTR'
+VERSION = 1
+KIND_PROCESSES = 1
+KIND_ACTIONS = 2
+EXTENSION = '.trace'
+
+HEADER = struct.Struct('<4sHBxIIII')
+RECORD = struct.Struct('<iiii')
+FIELDS_PER_RECORD = 4
+STRING_LENGTH = struct.Struct('<H')
+
+Record = Tuple[int, int, int, int]
+
+class TraceFormatError(Exception):
+    pass
+
+def is_trace_file(file_path: str) -> bool:
+    try:
+        with open(file_path, 'rb') as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+def _encode_strings(strings: List[str]) -> bytes:
+    chunks = []
+    for text in strings:
+        encoded = text.encode('utf-8')
+        if len(encoded) > 0xFFFF:
+            raise TraceFormatError(f"Cadena demasiado larga para la traza: '{text[:20]}...'")
+        chunks.append(STRING_LENGTH.pack(len(encoded)))
+        chunks.append(encoded)
+    return b''.join(chunks)
+
+def _write_strings(file: BinaryIO, strings: Iterable[str], batch_size: int) -> int:
+    count = 0
+    for batch in iter(lambda: list(islice(strings, batch_size)), []):
+        file.write(_encode_strings(batch))
+        count += len(batch)
+    return count
+
+def write_trace(file_path: str, kind: int, pids: Iterable[str], resources: Iterable[str],
+                records: Iterable[Record], batch_size: int = 65536) -> int:
+    """Stream a trace to disk one batch at a time and return its record count."""
+    pids, resources, records = iter(pids), iter(resources), iter(records)
+    with open(file_path, 'wb') as file:
+        file.write(b'\0' * HEADER.size)
+        pid_count = _write_strings(file, pids, batch_size)
+        resource_count = _write_strings(file, resources, batch_size)
+        padding = -file.tell() % 4
+        file.write(b'\0' * padding)
+        records_offset = file.tell()
+
+        record_count = 0
+        for batch in iter(lambda: list(islice(records, batch_size)), []):
+            values = array('i', chain.from_iterable(batch))
+            if len(values) != FIELDS_PER_RECORD * len(batch):
+                raise TraceFormatError("Cada registro de la traza debe tener 4 campos")
+            if sys.byteorder == 'big':
+                values.byteswap()
+            file.write(values.tobytes())
+            record_count += len(batch)
+
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, kind, record_count, pid_count,
+                               resource_count, records_offset))
+    return record_count
+
+def _write(file_path: str, kind: int, pids: List[str], resources: List[str],
+           columns: Tuple[array, array, array, array]) -> None:
+    write_trace(file_path, kind, pids, resources, zip(*columns))
+
+def write_process_trace(table: ProcessTable, file_path: str) -> None:
+    pid_indexes = array('i', range(len(table)))
+    _write(file_path, KIND_PROCESSES, table.pids, [],
+           (pid_indexes, table.burst_times, table.arrival_times, table.priorities))
+
+def write_action_trace(table: ActionTable, file_path: str) -> None:
+    _write(file_path, KIND_ACTIONS, table.pids, table.resources,
+           (table.pid_column, table.type_column, table.resource_column, table.cycle_column))
+
+def convert_processes(text_path: str, trace_path: str) -> int:
+    from utils.file_loader import FileLoader
+    table = FileLoader.load_process_table(text_path)
+    write_process_trace(table, trace_path)
+    return len(table)
+
+def convert_actions(text_path: str, trace_path: str) -> int:
+    from utils.file_loader import FileLoader
+    table = FileLoader.load_action_table(text_path)
+    write_action_trace(table, trace_path)
+    return len(table)
+
+class TraceFile:
+    """Read-only, memory-mapped view over a binary trace, validated once on open."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise TraceFormatError(f"Archivo de traza vacío: {file_path}")
+        self._view: Optional[memoryview] = None
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self._map) < HEADER.size:
+            raise TraceFormatError(f"Cabecera de traza incompleta: {self.file_path}")
+
+        (magic, self.version, self.kind, self.record_count, pid_count,
+         resource_count, records_offset) = HEADER.unpack_from(self._map, 0)
+
+        if magic != MAGIC:
+            raise TraceFormatError(f"No es un archivo de traza: {self.file_path}")
+        if self.version != VERSION:
+            raise TraceFormatError(
+                f"Versión de traza no soportada {self.version}, se esperaba {VERSION}"
+            )
+        if self.kind not in (KIND_PROCESSES, KIND_ACTIONS):
+            raise TraceFormatError(f"Tipo de traza desconocido: {self.kind}")
+        if records_offset + self.record_count * RECORD.size > len(self._map):
+            raise TraceFormatError(f"Traza truncada: {self.file_path}")
+
+        offset = HEADER.size
+        self.pids, offset = self._read_strings(offset, pid_count)
+        self.resources, offset = self._read_strings(offset, resource_count)
+        if offset > records_offset:
+            raise TraceFormatError(f"Tabla de cadenas corrupta: {self.file_path}")
+
+        self._view = memoryview(self._map)[
+            records_offset:records_offset + self.record_count * RECORD.size]
+        self._validate()
+
+    def _validate(self) -> None:
+        """Check every record once so readers can index the string tables blindly."""
+        if self.kind == KIND_PROCESSES:
+            checks = ((0, 0, len(self.pids) - 1, "índice de PID fuera de rango"),
+                      (1, 1, None, "el tiempo de ráfaga debe ser positivo"),
+                      (2, 0, None, "el tiempo de llegada no puede ser negativo"),
+                      (3, 0, None, "la prioridad no puede ser negativa"))
+        else:
+            checks = ((0, 0, len(self.pids) - 1, "índice de PID fuera de rango"),
+                      (1, 0, len(ACTION_TYPES) - 1, "código de acción desconocido"),
+                      (2, 0, len(self.resources) - 1, "índice de recurso fuera de rango"),
+                      (3, 0, None, "el ciclo no puede ser negativo"))
+        if not self.record_count:
+            return
+
+        for field, low, high, problem in checks:
+            values = self.column(field)
+            if min(values) >= low and (high is None or max(values) <= high):
+                continue
+            for index, value in enumerate(values):
+                if value < low or (high is not None and value > high):
+                    raise TraceFormatError(
+                        f"Registro {index}: {problem} ({value}) en {self.file_path}")
+
+        if len(set(self.pids)) != len(self.pids):
+            raise TraceFormatError(f"PID duplicado en la tabla de la traza: {self.file_path}")
+        if self.kind == KIND_PROCESSES:
+            seen = bytearray(len(self.pids))
+            for index, pid_index in enumerate(self.column(0)):
+                if seen[pid_index]:
+                    raise TraceFormatError(
+                        f"Registro {index}: PID duplicado '{self.pids[pid_index]}' "
+                        f"en {self.file_path}")
+                seen[pid_index] = 1
+
+    def _read_strings(self, offset: int, count: int) -> Tuple[List[str], int]:
+        strings = []
+        data = self._map
+        for _ in range(count):
+            (length,) = STRING_LENGTH.unpack_from(data, offset)
+            offset += STRING_LENGTH.size
+            strings.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+        return strings, offset
+
+    def close(self) -> None:
+        """Close the file; views still held from ``column`` keep the mapping alive."""
+        view, self._view = self._view, None
+        data, self._map = self._map, None
+        try:
+            if view is not None:
+                try:
+                    view.release()
+                except BufferError:
+                    # A caller still holds a view derived from this one.
+                    pass
+            if data is not None:
+                try:
+                    data.close()
+                except BufferError:
+                    pass
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> 'TraceFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    @property
+    def records(self) -> memoryview:
+        """Raw little-endian record bytes, ``RECORD.size`` bytes per record."""
+        return self._view
+
+    def record(self, index: int) -> Record:
+        if not 0 <= index < self.record_count:
+            raise IndexError("trace record index out of range")
+        return RECORD.unpack_from(self._view, index * RECORD.size)
+
+    def __iter__(self) -> Iterator[Record]:
+        return RECORD.iter_unpack(self._view)
+
+    def column(self, field: int):
+        """One field of every record; a strided view of the map on little-endian hosts."""
+        if sys.byteorder == 'little':
+            return self._view.cast('i')[field::FIELDS_PER_RECORD]
+        values = array('i', self._view.tobytes())
+        values.byteswap()
+        return values[field::FIELDS_PER_RECORD]
+
+    def process_rows(self) -> Iterator[Tuple[str, int, int, int]]:
+        self._expect(KIND_PROCESSES)
+        pids = self.pids
+        for pid_index, burst_time, arrival_time, priority in self:
+            yield pids[pid_index], burst_time, arrival_time, priority
+
+    def action_rows(self) -> Iterator[Tuple[str, object, str, int]]:
+        self._expect(KIND_ACTIONS)
+        pids, resources = self.pids, self.resources
+        for pid_index, type_code, resource_index, cycle in self:
+            yield pids[pid_index], ACTION_TYPES[type_code], resources[resource_index], cycle
+
+    def to_processes(self) -> List[Process]:
+        return [Process(*row) for row in self.process_rows()]
+
+    def to_actions(self) -> List[Action]:
+        return [Action(*row) for row in self.action_rows()]
+
+    def _expect(self, kind: int) -> None:
+        if self.kind != kind:
+            expected = "procesos" if kind == KIND_PROCESSES else "acciones"
+            raise TraceFormatError(f"La traza {self.file_path} no contiene {expected}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Convierte archivos .txt de procesos o acciones al formato binario de traza")
+    parser.add_argument('kind', choices=['processes', 'actions'])
+    parser.add_argument('source')
+    parser.add_argument('target')
+    args = parser.parse_args(argv)
+
+    convert = convert_processes if args.kind == 'processes' else convert_actions
+    count = convert(args.source, args.target)
+    print(f"{count} registros escritos en {args.target}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())